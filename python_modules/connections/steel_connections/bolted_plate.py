@@ -10,17 +10,76 @@ __license__= "GPL"
 __version__= "3.0"
 __email__= "l.pereztato@ciccp.es, ana.ortega@ciccp.es "
 
+import sys
 import math
 import json
+try:
+    import orjson # faster JSON encoder (optional).
+except ModuleNotFoundError:
+    orjson= None
 import importlib
+import numpy as np
+from scipy.spatial import cKDTree
 import geom
 from import_export import block_topology_entities as bte
 from misc_utils import log_messages as lmsg
 from connections.steel_connections import plates
 
+# Vertices of the octagon inscribed in the unit circle (same
+# vertices and order as geom.Circle2d.getInscribedPolygon(8, 0.0)).
+_unitOctagon= np.array([np.cos(np.arange(8)*math.pi/4.0), np.sin(np.arange(8)*math.pi/4.0)])
+
+def getGlobalPositions(refSys, xs, ys):
+    ''' Return the global positions of the points of the XY plane
+        of the reference system whose local coordinates are
+        given by the arrays argument.
+
+    :param refSys: 3D reference system.
+    :param xs: local x coordinates of the points.
+    :param ys: local y coordinates of the points.
+    '''
+    org= refSys.getOrg()
+    iVector= refSys.getIVector()
+    jVector= refSys.getJVector()
+    axes= np.array([[iVector.x, iVector.y, iVector.z], [jVector.x, jVector.y, jVector.z]])
+    pts= np.column_stack((xs, ys)) @ axes + [org.x, org.y, org.z]
+    return [geom.Pos3d(x, y, z) for x, y, z in pts.tolist()]
+
+def _is_finite_data(obj):
+    ''' Return true if all the numbers contained in the argument
+        are finite (orjson writes NaN and infinity as null, so
+        these values can't be written with it).
+
+    :param obj: value to check (number, string, list, dictionary...).
+    '''
+    if(isinstance(obj, float)):
+        return math.isfinite(obj)
+    elif(isinstance(obj, dict)):
+        return all(_is_finite_data(value) for value in obj.values())
+    elif(isinstance(obj, (list, tuple))):
+        return all(_is_finite_data(value) for value in obj)
+    elif(isinstance(obj, np.ndarray)):
+        return (obj.dtype.kind not in 'fc') or bool(np.isfinite(obj).all())
+    return True
+
+_boltClasses= dict() # bolt classes already resolved by getBoltClass.
+
+def getBoltClass(boltClassName):
+    ''' Return the bolt class corresponding to the fully qualified
+        name argument (i.e. 'materials.astm_aisc.ASTM_materials.BoltFastener').
+        The classes are cached so the module is imported only once.
+
+    :param boltClassName: fully qualified name of the bolt class.
+    '''
+    retval= _boltClasses.get(boltClassName)
+    if(retval is None):
+        moduleName, className= boltClassName.rsplit('.', 1)
+        module= importlib.import_module(moduleName)
+        retval= getattr(module, className)
+        _boltClasses[boltClassName]= retval
+    return retval
 
 class BoltArrayBase(object):
-    distances= [50e-3, 75e-3, 100e-3, 120e-3, 150e-3, 200e-3, 250e-3,.3,.4,.5,.6,.7,.8,.9]
     ''' Base class for bolt array. This class must be code agnostic
         i.e. no AISC, EC3, EAE clauses here. There is certainly some
         work to do in that sense (LP 09/2020). 
@@ -31,6 +90,9 @@ class BoltArrayBase(object):
     :ivar dist: distance between rows and columns
                  (defaults to three diameters).
     '''
+    distances= [50e-3, 75e-3, 100e-3, 120e-3, 150e-3, 200e-3, 250e-3,.3,.4,.5,.6,.7,.8,.9]
+    _distancesArray= np.array(distances) # sorted, used for binary search.
+    __slots__= ('bolt', '_nRows', '_nCols', '_dist', '_center', '_localXY', '_localPos')
     def __init__(self, bolt, nRows= 1, nCols= 1, dist= None):
         ''' Constructor.
 
@@ -40,17 +102,65 @@ class BoltArrayBase(object):
         :param dist: distance between rows and columns
                      (defaults to three diameters).
         '''
+        self._clearPositionsCache()
         self.bolt= bolt
         self.nRows= nRows
         self.nCols= nCols
         if(dist):
             self.dist= dist
         else:
-            tmp= 3.0*self.bolt.diameter
-            for d in self.distances:
-                if(d>= tmp):
-                    self.dist= d
-                    break
+            self.dist= self.getStandardDistance(3.0*self.bolt.diameter)
+
+    def _clearPositionsCache(self):
+        ''' Clear the cached values of the bolt positions.'''
+        self._center= None
+        self._localXY= None
+        self._localPos= None
+
+    @property
+    def nRows(self):
+        ''' Return the number of rows.'''
+        return self._nRows
+
+    @nRows.setter
+    def nRows(self, value):
+        ''' Set the number of rows.'''
+        self._nRows= value
+        self._clearPositionsCache()
+
+    @property
+    def nCols(self):
+        ''' Return the number of columns.'''
+        return self._nCols
+
+    @nCols.setter
+    def nCols(self, value):
+        ''' Set the number of columns.'''
+        self._nCols= value
+        self._clearPositionsCache()
+
+    @property
+    def dist(self):
+        ''' Return the distance between rows and columns.'''
+        return self._dist
+
+    @dist.setter
+    def dist(self, value):
+        ''' Set the distance between rows and columns.'''
+        self._dist= value
+        self._clearPositionsCache()
+
+    @classmethod
+    def getStandardDistance(cls, minValue):
+        ''' Return the first of the standard distances that is greater
+            or equal to the argument (None if there is no such distance).
+
+        :param minValue: minimum value of the distance.
+        '''
+        idx= np.searchsorted(cls._distancesArray, minValue)
+        if(idx<len(cls._distancesArray)):
+            return float(cls._distancesArray[idx])
+        return None
 
     def getNumberOfBolts(self):
         ''' Return the number of bolts of the array.'''
@@ -94,11 +204,9 @@ class BoltArrayBase(object):
             imposed by the bolt arrangement.'''
         minLength= self.getMinPlateLength()
         stdLength= max(minLength,self.getLength()+self.dist)
-        retval= stdLength
-        for d in self.distances:
-            if(d>= stdLength):
-                retval= d
-                break
+        retval= self.getStandardDistance(stdLength)
+        if(retval is None):
+            retval= stdLength
         return retval
 
     def getNetWidth(self, plateWidth):
@@ -140,38 +248,54 @@ class BoltArrayBase(object):
         return ' number of rows: '+str(self.nRows)+' number of columns: '+str(self.nCols)+' distance between centers: '+str(self.dist)+ ' bolts: '+str(self.bolt) 
     def getDict(self):
         ''' Put member values in a dictionary.'''
-        boltClassName= str(self.bolt.__class__)[8:-2]
+        boltClass= type(self.bolt)
+        boltClassName= boltClass.__module__+'.'+boltClass.__qualname__
         return {'boltClassName':boltClassName,'bolt':self.bolt.getDict(), 'nRows':self.nRows, 'nCols':self.nCols, 'dist':self.dist}    
 
     def setFromDict(self,dct):
         ''' Read member values from a dictionary.'''
-        tmp= dct['boltClassName'].rsplit('.', 1)
-        boltClassName= tmp[1]
-        moduleName= tmp[0]
-        module= importlib.import_module(moduleName)
-        cls= getattr(module, boltClassName)
+        cls= getBoltClass(dct['boltClassName'])
         self.bolt= cls(diameter= 0.004)
         self.bolt.setFromDict(dct['bolt'])
         self.nRows= dct['nRows']
         self.nCols= dct['nCols']
         self.dist= dct['dist']
 
+    def _getCenterXY(self):
+        ''' Return the coordinates of the bolt array centroid.'''
+        if(self._center is None):
+            x0= self.dist*(self.nCols-1)/2.0
+            y0= self.dist*(self.nRows-1)/2.0
+            self._center= (x0, y0)
+        return self._center
+
     def getCenter(self):
         ''' Return the position of the bolt array centroid.'''
-        x0= self.dist*(self.nCols-1)/2.0
-        y0= self.dist*(self.nRows-1)/2.0
-        return geom.Pos2d(x0,y0)
+        return geom.Pos2d(*self._getCenterXY())
+        
+    def _getLocalXY(self):
+        ''' Return two arrays containing the local x and y coordinates
+            of the bolts (column by column, as in getLocalPositions).'''
+        if(self._localXY is None):
+            x0, y0= self._getCenterXY()
+            xi= np.arange(self.nCols)*self.dist-x0
+            yi= np.arange(self.nRows)*self.dist-y0
+            xs, ys= np.meshgrid(xi, yi, indexing= 'ij')
+            xs= xs.ravel()
+            ys= ys.ravel()
+            # The arrays are shared by all the callers.
+            xs.flags.writeable= False
+            ys.flags.writeable= False
+            self._localXY= (xs, ys)
+        return self._localXY
         
     def getLocalPositions(self):
         ''' Return the local coordinates of the bolts.'''
-        retval= list()
-        center= self.getCenter()
-        for j in range(0,self.nCols):
-            for i in range(0,self.nRows):
-                x= j*self.dist-center.x
-                y= i*self.dist-center.y
-                retval.append(geom.Pos2d(x, y))
-        return retval
+        if(self._localPos is None):
+            xs, ys= self._getLocalXY()
+            self._localPos= list(zip(xs.tolist(), ys.tolist()))
+        # New objects each time, so the caller can modify them.
+        return [geom.Pos2d(x, y) for x, y in self._localPos]
 
     def getColumnPositions(self, j):
         ''' Return the local coordinates of the bolts at
@@ -179,13 +303,10 @@ class BoltArrayBase(object):
 
         :param j: index of the column.
         '''
-        retval= list()
-        center= self.getCenter()
-        for i in range(0,self.nRows):
-            x= j*self.dist-center.x
-            y= i*self.dist-center.y
-            retval.append(geom.Pos2d(x, y))
-        return retval
+        xs, ys= self._getLocalXY()
+        first= j*self.nRows
+        last= first+self.nRows
+        return [geom.Pos2d(x, y) for x, y in zip(xs[first:last].tolist(), ys[first:last].tolist())]
     
     def getRowPositions(self, i):
         ''' Return the local coordinates of the bolts at
@@ -193,13 +314,8 @@ class BoltArrayBase(object):
 
         :param i: index of the column.
         '''
-        retval= list()
-        center= self.getCenter()
-        for j in range(0,self.nCols):
-            x= j*self.dist-center.x
-            y= i*self.dist-center.y
-            retval.append(geom.Pos2d(x, y))
-        return retval
+        xs, ys= self._getLocalXY()
+        return [geom.Pos2d(x, y) for x, y in zip(xs[i::self.nRows].tolist(), ys[i::self.nRows].tolist())]
     
     def getClearDistances(self, contour, loadDirection):
         ''' Return the clear distance between the edge of the hole and
@@ -208,12 +324,8 @@ class BoltArrayBase(object):
         :param contour: 2D polygon defining the bolted plate contour.
         :param loadDirection: direction of the load.
         '''
-        retval= list()
-        localPos= self.getLocalPositions()
-        for pLocal in localPos:
-            cover= contour.getCover(pLocal, loadDirection)
-            retval.append(min(self.dist,cover))
-        return retval
+        covers= contour.getCovers(self.getLocalPositions(), loadDirection)
+        return [min(self.dist,cover) for cover in covers]
     
     def getMinimumCover(self, contour):
         ''' Return the minimum of the distances between the centers
@@ -222,12 +334,8 @@ class BoltArrayBase(object):
         :param contour: 2D polygon defining the bolted plate contour.
         :param loadDirection: direction of the load.
         '''
-        retval= 1e6
-        localPos= self.getLocalPositions()
-        for pLocal in localPos:
-            cover= contour.getCover(pLocal)
-            retval= min(retval,cover)
-        return retval
+        covers= contour.getCovers(self.getLocalPositions())
+        return min(covers, default= 1e6)
 
     def getMinimumCoverInDir(self, contour, direction):
         ''' Return the minimum of the distances between the centers
@@ -237,12 +345,8 @@ class BoltArrayBase(object):
         :param contour: 2D polygon defining the bolted plate contour.
         :param direction: direction of the rays.
         '''
-        retval= 1e6
-        localPos= self.getLocalPositions()
-        for pLocal in localPos:
-            cover= contour.getCover(pLocal, direction)
-            retval= min(retval,cover)
-        return retval
+        covers= contour.getCovers(self.getLocalPositions(), direction)
+        return min(covers, default= 1e6)
         
     def getHoleBlocks(self, refSys= geom.Ref3d3d(), blockProperties= None):
         ''' Return octagons inscribed in the holes.
@@ -251,20 +355,19 @@ class BoltArrayBase(object):
                        the geometry of the holes.
         :param blockProperties: labels and attributes of the holes.
         '''
-        localPos= self.getLocalPositions()
-        holes= list()
-        for pLocal in localPos:
-            circle= geom.Circle2d(pLocal,self.bolt.getNominalHoleDiameter()/2.0)
-            octagon= circle.getInscribedPolygon(8,0.0).getVertexList()
-            holes.append((pLocal,octagon))
+        xs, ys= self._getLocalXY()
+        # Vertices of the octagons inscribed in the holes: arrays of
+        # shape (number of bolts, 8).
+        radius= self.bolt.getNominalHoleDiameter()/2.0
+        holesX= xs[:,np.newaxis]+radius*_unitOctagon[0]
+        holesY= ys[:,np.newaxis]+radius*_unitOctagon[1]
+        holesVertices= getGlobalPositions(refSys, holesX.ravel(), holesY.ravel())
+        holesCenters= getGlobalPositions(refSys, xs, ys)
         retval= bte.BlockData()
         # Base points (A)
-        for h in holes:
+        for i, center3d in enumerate(holesCenters):
             # Hole vertices.
-            holeVertices= list()
-            for v in h[1]:
-                p3d= geom.Pos3d(v.x,v.y,0.0)
-                holeVertices.append(refSys.getGlobalPosition(p3d))
+            holeVertices= holesVertices[8*i:8*i+8]
             blk= retval.blockFromPoints(holeVertices, blockProperties)
             # Hole center.
             centerProperties= bte.BlockProperties.copyFrom(blockProperties)
@@ -272,8 +375,6 @@ class BoltArrayBase(object):
             centerProperties.appendAttribute('ownerId', 'f'+str(blk.id)) # Hole center owner.
             centerProperties.appendAttribute('diameter', self.bolt.diameter)
             centerProperties.appendAttribute('boltMaterial', self.bolt.steelType.name)
-            center= h[0]
-            center3d= refSys.getGlobalPosition(geom.Pos3d(center.x, center.y, 0.0))
             retval.appendPoint(-1, center3d.x, center3d.y, center3d.z, pointProperties= centerProperties)
         return retval
                     
@@ -282,12 +383,8 @@ class BoltArrayBase(object):
 
         :param refSys: 3D reference system.
         '''
-        localPos= self.getLocalPositions()
-        retval= list()
-        for pLocal in localPos:
-            p3d= geom.Pos3d(pLocal.x,pLocal.y, 0.0)
-            retval.append(refSys.getGlobalPosition(p3d))
-        return retval
+        xs, ys= self._getLocalXY()
+        return getGlobalPositions(refSys, xs, ys)
     
     def report(self, outputFile):
         ''' Reports connection design values.'''
@@ -322,6 +419,7 @@ class BoltedPlateBase(plates.Plate):
                             of the main member.
         '''
         super(BoltedPlateBase,self).__init__(width= width, length= length, thickness= thickness, steelType= steelType, notched= notched)
+        self._corePoly= None # cached core contour (see getCorePolygon).
         self.setBoltArray(boltArray)
         self.eccentricity= eccentricity
         self.doublePlate= doublePlate
@@ -354,19 +452,15 @@ class BoltedPlateBase(plates.Plate):
     def computeWidth(self):
         ''' Compute the plate width from the bolt
             arrangement.'''
-        minWidth= self.getMinWidth()
-        for d in self.boltArray.distances:
-            if(d>= minWidth):
-                self.width= d
-                break
+        d= self.boltArray.getStandardDistance(self.getMinWidth())
+        if(d is not None):
+            self.width= d
             
     def computeLength(self):
         ''' Assigns the bolt arrangement.'''
-        minLength= self.getMinLength()
-        for d in self.boltArray.distances:
-            if(d>= minLength):
-                self.length= d
-                break
+        d= self.boltArray.getStandardDistance(self.getMinLength())
+        if(d is not None):
+            self.length= d
         
     def computeDimensions(self):
         ''' Compute the plate dimensions from the bolt
@@ -434,22 +528,13 @@ class BoltedPlateBase(plates.Plate):
             CF= self.getShearStrengthEfficiency(-internalForces.N)
         else:
             CF= self.getShearStrengthEfficiency(internalForces.N)
-        if(abs(internalForces.My)>1e-3):
-            className= type(self).__name__
-            methodName= sys._getframe(0).f_code.co_name
-            lmsg.error(className+'.'+methodName+'; bending not implemented yet.')
-        if(abs(internalForces.Mz)>1e-3):
-            className= type(self).__name__
-            methodName= sys._getframe(0).f_code.co_name
-            lmsg.error(className+'.'+methodName+'; bending not implemented yet.')
-        if(abs(internalForces.Vy)>1e-3):
-            className= type(self).__name__
-            methodName= sys._getframe(0).f_code.co_name
-            lmsg.error(className+'.'+methodName+'; shear not implemented yet.')
-        if(abs(internalForces.Vz)>1e-3):
+        # Only axial forces are considered yet (the most common case).
+        unsupported= (abs(internalForces.My)>1e-3, abs(internalForces.Mz)>1e-3, abs(internalForces.Vy)>1e-3, abs(internalForces.Vz)>1e-3)
+        if(any(unsupported)):
             className= type(self).__name__
-            methodName= sys._getframe(0).f_code.co_name
-            lmsg.error(className+'.'+methodName+'; shear not implemented yet.')
+            for flag, effort in zip(unsupported, ('bending', 'bending', 'shear', 'shear')):
+                if(flag):
+                    lmsg.error(className+'.getEfficiency; '+effort+' not implemented yet.')
         return CF
 
     def __str__(self):
@@ -485,6 +570,15 @@ class BoltedPlateBase(plates.Plate):
         w2= self.width/2.0
         return [geom.Pos2d(-l2+self.eccentricity.x,-w2+self.eccentricity.y), geom.Pos2d(l2+self.eccentricity.x,-w2+self.eccentricity.y), geom.Pos2d(l2+self.eccentricity.x,w2+self.eccentricity.y), geom.Pos2d(-l2+self.eccentricity.x,w2+self.eccentricity.y)]
     
+    def getCorePolygon(self):
+        ''' Return the polygon defined by the plate core contour. The 
+            polygon is cached and only recomputed when the length,
+            the width or the eccentricity of the plate change.'''
+        key= (self.length, self.width, self.eccentricity.x, self.eccentricity.y)
+        if((self._corePoly is None) or (self._corePoly[0]!=key)):
+            self._corePoly= (key, geom.Polygon2d(self.getCoreContour2d()))
+        return self._corePoly[1]
+    
     def getObjectTypeAttr(self):
         ''' Return the object type attribute (used in getBlocks).'''
         return 'bolted_plate'
@@ -530,17 +624,17 @@ class BoltedPlateBase(plates.Plate):
 
         :param loadDirection: direction of the load.
         '''
-        contour= geom.Polygon2d(self.getCoreContour2d())
+        contour= self.getCorePolygon()
         retval= self.boltArray.getClearDistances(contour, loadDirection)
         return retval
-    
+
     def getMinimumCover(self):
         ''' Return the minimum of the distances between the centers
             of the holes and the plate contour.
 
         :param loadDirection: direction of the load.
         '''
-        contour= geom.Polygon2d(self.getCoreContour2d())
+        contour= self.getCorePolygon()
         return self.boltArray.getMinimumCover(contour)
 
     def getMinimumCoverInDir(self, direction):
@@ -550,18 +644,49 @@ class BoltedPlateBase(plates.Plate):
 
         :param direction: direction of the rays.
         '''
-        contour= geom.Polygon2d(self.getCoreContour2d())
+        contour= self.getCorePolygon()
         return self.boltArray.getMinimumCoverInDir(contour, direction)
 
+    def jsonRead(self, inputFileName):
+        ''' Read object from JSON file.
+
+        :param inputFileName: name of the input file.
+        '''
+        with open(inputFileName, 'rb') as inputFile:
+            data= inputFile.read()
+        if(orjson):
+            try:
+                inputDict= orjson.loads(data)
+            except orjson.JSONDecodeError: # NaN or infinity written by json.
+                inputDict= json.loads(data)
+        else:
+            inputDict= json.loads(data)
+        self.setFromDict(inputDict)
+
     def jsonWrite(self, outputFileName):
-        ''' Write object to JSON file.
+        ''' Write object to JSON file. If orjson is available it's used
+            to write the file, so the output is more compact than the
+            json.dump one (no whitespace after the separators, UTF-8
+            instead of escaped non-ASCII characters, shortest float
+            representation) but it is read back to the same values.
+            Dictionaries containing NaN or infinite values (written as
+            null by orjson) or non-string keys are written with json.
 
         :param outputFileName: name of the output file.
         '''
         outputDict= self.getDict()
-        with open(outputFileName, 'w') as outfile:
-            json.dump(outputDict, outfile)
-        outfile.close()
+        data= None
+        if(orjson and _is_finite_data(outputDict)):
+            try:
+                data= orjson.dumps(outputDict, option= orjson.OPT_SERIALIZE_NUMPY)
+            except orjson.JSONEncodeError: # non-string keys,...
+                data= None
+        if(data is not None):
+            with open(outputFileName, 'wb') as outfile:
+                outfile.write(data)
+        else:
+            with open(outputFileName, 'w') as outfile:
+                json.dump(outputDict, outfile)
 
 
 def getBoltedPointBlocks(gussetPlateBlocks, boltedPlateBlocks, distBetweenPlates, blockProperties):
@@ -574,26 +699,35 @@ def getBoltedPointBlocks(gussetPlateBlocks, boltedPlateBlocks, distBetweenPlates
     '''
     retval= bte.BlockData()
     # Hole centers in the gusset plate.
-    gussetPlateBoltCenters= list()
-    for key in gussetPlateBlocks.points:
-        p= gussetPlateBlocks.points[key]
-        if(p.getAttribute('objType')=='hole_center'):
-            gussetPlateBoltCenters.append(p)
+    gussetPlateBoltCenters= gussetPlateBlocks.getPointsByType().get('hole_center', [])
     # Hole center in the bolted plate.
-    boltedPlateBoltCenters= list()
-    for key in boltedPlateBlocks.points:
-        p= boltedPlateBlocks.points[key]
-        if(p.getAttribute('objType')=='hole_center'):
-            boltedPlateBoltCenters.append(p)
+    boltedPlateBoltCenters= boltedPlateBlocks.getPointsByType().get('hole_center', [])
     tol= distBetweenPlates/100.0
     # Bolt properties.
     boltProperties= bte.BlockProperties.copyFrom(blockProperties)
     boltProperties.appendAttribute('objType', 'bolt_axis')
     boltProperties.appendAttribute('ownerId', None) # Has no owner.
-    for pA in gussetPlateBoltCenters:
-        for pB in boltedPlateBoltCenters:
-            dist= math.sqrt((pA.coords[0]-pB.coords[0])**2+(pA.coords[1]-pB.coords[1])**2+(pA.coords[2]-pB.coords[2])**2)
-            if(abs(dist-distBetweenPlates)<tol):
-                boltBlk= bte.BlockRecord(id= -1, typ= 'line', kPoints= [pA.id, pB.id], blockProperties= boltProperties)
-                id= retval.appendBlock(boltBlk)
+    # Compare squared distances to avoid computing square roots.
+    lo2= (distBetweenPlates-tol)**2
+    hi2= (distBetweenPlates+tol)**2
+    if(gussetPlateBoltCenters and boltedPlateBoltCenters):
+        coordsA= np.array([p.coords[:3] for p in gussetPlateBoltCenters], dtype= float)
+        coordsB= np.array([p.coords[:3] for p in boltedPlateBoltCenters], dtype= float)
+        # Candidate pairs: points of B inside the sphere of radius
+        # distBetweenPlates+tol centered on each point of A.
+        candidates= cKDTree(coordsA).query_ball_tree(cKDTree(coordsB), r= distBetweenPlates+tol)
+        # Flatten the candidate pairs (keeping the original pairing order)
+        # and filter all of them with a single vectorized operation.
+        pairs= [(i, j) for i, js in enumerate(candidates) for j in sorted(js)]
+        if(pairs):
+            iA, iB= np.array(pairs).T
+            dists2= ((coordsB[iB]-coordsA[iA])**2).sum(axis= 1)
+            matched= (dists2>lo2) & (dists2<hi2)
+            # Local aliases to avoid attribute lookups inside the loop.
+            BlockRecord= bte.BlockRecord
+            appendBlock= retval.appendBlock
+            for i, j in zip(iA[matched].tolist(), iB[matched].tolist()):
+                pA= gussetPlateBoltCenters[i]
+                pB= boltedPlateBoltCenters[j]
+                appendBlock(BlockRecord(id= -1, typ= 'line', kPoints= [pA.ident, pB.ident], blockProperties= boltProperties))
     return retval
@@ -10,6 +10,8 @@ class Parabola(object):
     :ivar b: x factor.
     :ivar c: constant.
     '''
+    __slots__= ('a', 'b', 'c')
+    
     def __init__(self,p0,p1,p2):
         self.from3Points(p0,p1,p2)
       
@@ -21,30 +23,49 @@ class Parabola(object):
         y1= p1[1]
         x2= p2[0]
         y2= p2[1]
-        a= np.array([[x0**2,x0,1],[x1**2,x1,1],[x2**2,x2,1]])
-        b= np.array([y0,y1,y2])
-        abc= np.linalg.solve(a,b)
-        self.a= abc[0]
-        self.b= abc[1]
-        self.c= abc[2]
+        # Closed-form solution (divided differences), much cheaper than
+        # solving the 3x3 system with LAPACK.
+        m01= (y1-y0)/(x1-x0) # first divided differences.
+        m02= (y2-y0)/(x2-x0)
+        self.a= (m02-m01)/(x2-x1)
+        self.b= m01-self.a*(x0+x1)
+        self.c= y0-(self.a*x0+self.b)*x0
       
     def y(self,x):
-        ''' Return the ordinate value for x.'''
-        return self.a*x*x+self.b*x+self.c
+        ''' Return the ordinate value for x.
+
+        :param x: abscissa (float or NumPy array).
+        '''
+        return (self.a*x+self.b)*x+self.c
     
     def yP(self,x):
-        ''' Return the first derivative value for x.'''
+        ''' Return the first derivative value for x.
+
+        :param x: abscissa (float or NumPy array).
+        '''
         return 2.0*self.a*x+self.b
     
     def yPP(self,x):
-        ''' Return the second derivative value for x.'''
+        ''' Return the second derivative value for x.
+
+        :param x: abscissa (float or NumPy array).
+        '''
+        if(isinstance(x, np.ndarray)):
+            return np.full(x.shape, 2.0*self.a)
         return 2.0*self.a
     
     def curvature(self,x):
-        ''' Return the value of the curvature for x.'''
-        return self.yPP(x)/pow((1+self.yP(x)**2),3.0/2.0)
+        ''' Return the value of the curvature for x.
+
+        :param x: abscissa (float or NumPy array).
+        '''
+        return self.yPP(x)/(1+self.yP(x)**2)**1.5
     
     def alpha(self,x):
-        ''' Return the angle of the tangent for x.'''
+        ''' Return the angle of the tangent for x.
+
+        :param x: abscissa (float or NumPy array).
+        '''
+        if(isinstance(x, np.ndarray)):
+            return np.arctan(self.yP(x))
         return math.atan2(self.yP(x),1)
-  
@@ -8,7 +8,9 @@ __license__= "GPL"
 __version__= "3.0"
 __email__= "l.pereztato@gmail.com ana.ortega@ciccp.es"
 
+import numpy as np
 import geom
+from misc_utils import log_messages as lmsg
 
 class XYFoldingPlanes(object):
     xyPline= None
@@ -46,6 +48,54 @@ class XYFoldingPlanes(object):
             lmb= p.dist(P0proj)/P1proj.dist(P0proj)
             pInt= segment3d.getPoint(lmb)
             retval.append(pInt)
-        return retval  
+        return retval
+
+    def getIntersectionsWith3DSegments(self, segments):
+        ''' Return the intersections of each of the segments argument
+            with the folding planes.
 
+        Vertical segments (whose projection on the XY plane is a point) have
+        no single intersection point with the folding planes; the list
+        returned for them is empty.
 
+        :param segments: list of 3D segments or array of shape (N, 2, 3)
+                         containing the end points of N segments.
+        :returns: a list containing the intersection points of each segment.
+        '''
+        # Segment end points: array of shape (N, 2, 3).
+        if(isinstance(segments, np.ndarray)):
+            pts= np.asarray(segments, dtype= float)
+        else:
+            pts= list()
+            for sg in segments:
+                p0= sg.getFromPoint()
+                p1= sg.getToPoint()
+                pts.append([[p0.x, p0.y, p0.z],[p1.x, p1.y, p1.z]])
+            pts= np.array(pts, dtype= float)
+        retval= list()
+        if(pts.size==0):
+            return retval
+        if((pts.ndim!=3) or (pts.shape[1:]!=(2,3))):
+            raise ValueError('segment end points must have shape (N, 2, 3), got: '+str(pts.shape))
+        origins= pts[:,0,:]
+        dirs= pts[:,1,:]-origins
+        projLengths= np.hypot(dirs[:,0], dirs[:,1])
+        numVertical= 0
+        for org, vDir, projLength in zip(origins, dirs, projLengths):
+            if(projLength==0.0): # vertical segment.
+                numVertical+= 1
+                retval.append([])
+                continue
+            P0proj= geom.Pos2d(org[0], org[1])
+            P1proj= geom.Pos2d(org[0]+vDir[0], org[1]+vDir[1])
+            proj= self.xyPline.getIntersection(geom.Segment2d(P0proj,P1proj))
+            if(proj):
+                xy= np.array([[p.x, p.y] for p in proj], dtype= float)
+                lmbs= np.hypot(xy[:,0]-org[0], xy[:,1]-org[1])/projLength
+                pInt= org+lmbs[:,np.newaxis]*vDir
+                retval.append([geom.Pos3d(x, y, z) for x, y, z in pInt.tolist()])
+            else:
+                retval.append([])
+        if(numVertical>0):
+            lmsg.warning(str(numVertical)+' vertical segments ignored when intersecting them with the folding planes.')
+        return retval
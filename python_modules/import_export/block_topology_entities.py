@@ -481,6 +481,18 @@ class BlockData(object):
         pr= PointRecord(id,[x,y,z], pointProperties)
         self.points[pr.ident]= pr 
         return pr.ident
+
+    def getPointsByType(self):
+        ''' Return a dictionary with the points classified by the value
+            of their 'objType' attribute (the points without it are
+            ignored).
+        '''
+        retval= dict()
+        for p in self.points.values():
+            objType= p.getAttribute('objType')
+            if(objType is not None):
+                retval.setdefault(objType, list()).append(p)
+        return retval
         
     def appendBlock(self,block):
         ''' Append a block (line, surface, volume) to the 
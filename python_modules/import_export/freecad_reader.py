@@ -13,8 +13,9 @@ __email__= "l.pereztato@gmail.com" "ana.ortega.ort@gmail.com"
 import xc_base
 import sys
 import re
+import math
+import numpy as np
 from import_export import reader_base
-from scipy.spatial.distance import cdist
 from misc_utils import log_messages as lmsg
 from import_export import block_topology_entities as bte
 
@@ -72,31 +73,82 @@ def getType(obj):
         return 'App::Part'
     return 'Unknown'
     
-def get_ifc_attributes(obj):
-    ''' Return the ifc attributes of the argument.
+_MISSING= object() # sentinel for missing attributes.
+
+def _as_is(value):
+    ''' Return the value unchanged.'''
+    return value
+
+_MM_TO_M= 1e-3 # FreeCAD stores lengths internally in millimeters.
+
+def _to_meters(value):
+    ''' Return the length quantity argument expressed in meters (same
+        as value.getValueAs('m') without parsing the unit string).'''
+    return value.Value*_MM_TO_M
+
+def get_ifc_table():
+    ''' Return the (attribute name, converter) pairs read by
+        get_ifc_attributes (built from the current contents of the
+        ifcStringAttributes, ifcLengthAttributes and ifcAreaAttributes
+        lists).
+    '''
+    return tuple((name, _as_is) for name in ifcStringAttributes)+tuple((name, _to_meters) for name in ifcLengthAttributes)+tuple((name, _as_is) for name in ifcAreaAttributes) # area in square meters.
+
+def get_ifc_attributes(obj, ifcTable= None, attributesPool= None):
+    ''' Return the ifc attributes of the argument. If a pool is given,
+        objects with the same attributes share the same dictionary, so the
+        returned value must not be modified (copy it if needed).
 
     :param obj: object to get the IFC attributes from.
+    :param ifcTable: (attribute name, converter) pairs to read (if None
+                     they are obtained from get_ifc_table).
+    :param attributesPool: dictionary containing the attribute dictionaries
+                           already returned (if None the returned
+                           dictionary is not shared).
     '''
+    if(ifcTable is None):
+        ifcTable= get_ifc_table()
     retval= dict()
-    # Read "regular" attributes
-    for attrName in ifcStringAttributes:
-        if hasattr(obj,attrName):
-            retval[attrName]= getattr(obj,attrName)
-    # Read attributes that correspond to a lenght measurement.
-    for attrName in ifcLengthAttributes:
-        if hasattr(obj,attrName):
-            retval[attrName]= getattr(obj,attrName).getValueAs('m') # meter
-    # Read attributes that correspond to an area measurement.
-    for attrName in ifcAreaAttributes:
-        if hasattr(obj,attrName):
-            retval[attrName]= getattr(obj,attrName) # square meter
+    # Read "regular", length and area attributes.
+    for attrName, converter in ifcTable:
+        value= getattr(obj, attrName, _MISSING)
+        if(value is not _MISSING):
+            retval[attrName]= converter(value)
     # Read attributes that have a somewhat "special" treatment in XC.
-    if hasattr(obj,'Material') and obj.Material:
-        retval['Material']= obj.Material.Label
-    if hasattr(obj,'Description'):
-        retval['IfcDescription']= obj.Description
+    material= getattr(obj, 'Material', None)
+    if(material):
+        retval['Material']= material.Label
+    description= getattr(obj, 'Description', _MISSING)
+    if(description is not _MISSING):
+        retval['IfcDescription']= description
+    # Share the dictionary with the objects that have the same attributes.
+    if(attributesPool is not None):
+        try:
+            retval= attributesPool.setdefault(tuple(sorted(retval.items())), retval)
+        except TypeError: # unhashable values, don't share it.
+            pass
     return retval
     
+def _import_face_shape(reader, shape, objName, objLabel, facesDict, attributes):
+    ''' Import a shape of type 'Face'.'''
+    reader.importFace(shape, objName, objLabel, facesDict, attributes)
+
+def _import_shell_shape(reader, shape, objName, objLabel, facesDict, attributes):
+    ''' Import the faces of a shape of type 'Shell'.'''
+    for s in shape.SubShapes:
+        reader.importShape(s, objName, objLabel, facesDict, attributes)
+
+def _import_compound_shape(reader, shape, objName, objLabel, facesDict, attributes):
+    ''' Import the components of a shape of type 'Compound'.'''
+    prefix= objName+'.'
+    for cCount, ss in enumerate(shape.SubShapes):
+        reader.importShape(ss, prefix+str(cCount), objLabel, facesDict, attributes)
+
+# Functions that import each type of shape in FreeCADImport.importShape.
+_SHAPE_HANDLERS= {'Face': _import_face_shape, 'Shell': _import_shell_shape, 'Compound': _import_compound_shape}
+# Shape types that have no faces to import (nothing to do with those).
+_NOOP_SHAPES= frozenset({'Vertex', 'Wire'})
+    
 class FreeCADImport(reader_base.ReaderBase):
     '''Import FreeCAD geometric entities.
 
@@ -118,11 +170,7 @@ class FreeCADImport(reader_base.ReaderBase):
         self.compounds= dict() # Stack for compound names.
         if(len(self.groupsToImport)):
             self.kPointsNames= self.selectKPoints()
-            self.importPoints()
-            if(self.impLines):
-                self.importLines()
-            if(self.impSurfaces):
-                self.importFaces()
+            self.importEntities()
         else:
             self.kPoints= None
         
@@ -133,13 +181,13 @@ class FreeCADImport(reader_base.ReaderBase):
            :param namesToImport: list of regular expressions to be tested.
         '''
         retval= []
-        # Compile regular expressions.
-        regExpList= list()
-        for name in namesToImport:
-            regExpList.append(re.compile(name))
-        for obj in self.document.Objects:
-            if(reader_base.nameToImport(obj.Label, regExpList)):
-                retval.append(obj)
+        if(len(namesToImport)>0): # an empty alternation would match anything.
+            # Compile all the regular expressions into one.
+            regExp= re.compile('|'.join(f'(?:{name})' for name in namesToImport))
+            match= regExp.match # same semantics as reader_base.nameToImport.
+            for obj in self.document.Objects:
+                if(match(obj.Label)):
+                    retval.append(obj)
         if(len(retval)==0):
             lmsg.warning(f'No groups to import (names to import: {namesToImport})')
         return retval
@@ -154,248 +202,287 @@ class FreeCADImport(reader_base.ReaderBase):
             # group name as label.
             objProperties.extendLabels([groupLabel])
             retval_properties[pointName]= objProperties
+        def append_single(v, objName, groupLabel, objProperties):
+            '''Append the vertex argument to the lists using the
+               object name as point name.'''
+            append_point((v.X, v.Y, v.Z), groupLabel, objName, objProperties)
+        def append_many(vertexes, objName, groupLabel, objProperties):
+            '''Append the vertexes to the lists naming them with the
+               object name followed by the vertex index.'''
+            relativePoints= self.getRelativeCoos([(v.X, v.Y, v.Z) for v in vertexes])
+            objProperties.extendLabels([groupLabel])
+            prefix= objName+'.'
+            for ptCount, p in enumerate(relativePoints):
+                pointName= prefix+str(ptCount)
+                retval_pos[pointName]= p
+                retval_properties[pointName]= objProperties
         def append_points(vertexes, objName, groupLabel, objProperties):
             '''Append the points to the list.'''
             if(len(vertexes)>1):
-                for ptCount, v in enumerate(vertexes):
-                    pointName= f'{objName}.{ptCount}'
-                    append_point([v.X, v.Y, v.Z], groupLabel, pointName, objProperties)
+                append_many(vertexes, objName, groupLabel, objProperties)
             else:
-                v= vertexes[0]
-                append_point([v.X, v.Y, v.Z], groupLabel, objName, objProperties)
+                append_single(vertexes[0], objName, groupLabel, objProperties)
                 
         for grp in self.groupsToImport:
             groupLabel= grp.Label
-            if(hasattr(grp,'Shape')): # Object has shape.
+            shape= getattr(grp, 'Shape', None)
+            if(shape is not None): # Object has shape.
                 objName= grp.Name
-                shape= grp.Shape
                 shapeType= shape.ShapeType
                 objProperties= bte.BlockProperties(labels= [groupLabel])
                 if(shapeType=='Shell'):
+                    prefix= objName+'.'
                     for fCount, f in enumerate(shape.SubShapes):
-                        thisFaceName= f'{objName}.{fCount}'
+                        thisFaceName= prefix+str(fCount)
                         append_points(f.OuterWire.OrderedVertexes, thisFaceName, groupLabel, objProperties)
+                elif(shapeType=='Vertex'): # the shape is the vertex itself.
+                    append_single(shape, objName, groupLabel, objProperties)
                 else:
-                    append_points(grp.Shape.Vertexes, objName, groupLabel, objProperties)
+                    append_points(shape.Vertexes, objName, groupLabel, objProperties)
             elif(len(grp.OutList)>0): # Object is a group
                 for obj in grp.OutList: 
-                    if(hasattr(obj,'Shape')): # Object has shape.
-                        shapeType= obj.Shape.ShapeType
-                        objName= obj.Name
-                        objProperties= bte.BlockProperties(labels= [obj.Label])
-                        if(shapeType=='Face'):
-                            append_points(obj.Shape.Vertexes, objName, groupLabel, objProperties)
+                    objShape= getattr(obj, 'Shape', None)
+                    if(objShape is not None): # Object has shape.
+                        if(objShape.ShapeType=='Face'):
+                            objProperties= bte.BlockProperties(labels= [obj.Label])
+                            append_points(objShape.Vertexes, obj.Name, groupLabel, objProperties)
         return retval_pos, retval_properties
     
-    def importPoints(self):
-        ''' Import points from FreeCAD file.'''
+    def importEntities(self):
+        ''' Import points, lines and faces from FreeCAD file, visiting
+            each object only once.'''
         self.points= dict()
+        self.lines= dict()
+        if(self.impSurfaces):
+            self.facesTree= dict()
+            for obj in self.groupsToImport:
+                self.facesTree[obj.Label]= dict()
+        ifcTable= get_ifc_table() # attributes to read from each object.
+        attributesPool= dict() # attribute dictionaries shared during this import.
         for obj in self.groupsToImport:
-            if(hasattr(obj,'Shape')):
-                shape= obj.Shape
+            shape= getattr(obj, 'Shape', None)
+            if(shape is not None):
                 shapeType= shape.ShapeType
-                pointName= obj.Name
-                labelName= obj.Label
+                objName= obj.Name
+                objLabel= obj.Label
+                attributes= get_ifc_attributes(obj, ifcTable, attributesPool) # read them only once.
                 if(shapeType=='Vertex'):
-                    vertices= [-1]
-                    p= self.getRelativeCoo([float(shape.X), float(shape.Y), float(shape.Z)])
-                    vertices[0]= self.getIndexNearestPoint(p)
-                    self.points[pointName]= vertices
-                    pointAttributes= get_ifc_attributes(obj)
-                    properties= bte.BlockProperties(labels= [labelName], attributes= pointAttributes)
-                    self.propertyDict[pointName]= properties
-                    
-    def importLines(self):
-        ''' Import lines from FreeCAD file.'''
-        self.lines= dict()
+                    self.importPoint(shape, objName, objLabel, attributes)
+                if(self.impLines):
+                    self.importObjectLines(shape, shapeType, objName, objLabel, attributes)
+                if(self.impSurfaces):
+                    self.importObjectFaces(obj, shape, shapeType, objName, objLabel, attributes)
+        if(self.impSurfaces):
+            self.setCompoundsMembership()
+        
+    def importPoint(self, shape, pointName, labelName, pointAttributes):
+        ''' Import a point from FreeCAD file.
 
-        def import_edge(e, edgeName, labelName, edgeAttributes):
-            ''' Import an edge.
-            
-            :param e: edge to import.
-            :param edgeName: name of the edge object.
-            :param labelName: label of the parent object.
-            :param edgeAttributes: IFC attributes of the parent object.
-            '''
-            vertices= [-1,-1]
-            v0= e.Vertexes[0]
-            v1= e.Vertexes[1]
-            p1= self.getRelativeCoo([float(v0.X), float(v0.Y), float(v0.Z)])
-            p2= self.getRelativeCoo([float(v1.X), float(v1.Y), float(v1.Z)])
-            length= cdist([p1],[p2])[0][0]
-            # Try to have all lines with the
-            # same orientation.
-            idx0, idx1= self.getOrientation(p1, p2, length/1e4)
-            # end orientation.
-            vertices[0]= idx0
-            vertices[1]= idx1
-            if(vertices[0]==vertices[1]):
-                lmsg.error(f'Error in line {edgeName} vertices are equal: {vertices}')
-            if(length>self.threshold):
-                self.lines[edgeName]= vertices
-                objLabels= [labelName]
-                # # groups
-                # if(edgeName in self.entitiesGroups):
-                #     objLabels.extend(self.entitiesGroups[edgeName])
-                self.propertyDict[edgeName]= bte.BlockProperties(labels= objLabels, attributes= edgeAttributes)
-            else:
-                lmsg.error(f'line too short: {p1},{p2}, {length}')
-
-        def import_edges(edges, names, labelName, attributes):
-            ''' Import edges from a wire shape.
-            
-            :param edges: edge list.
-            :param names: list containing the names of the edges.
-            :param labelName: label of the parent object.
-            :param attributes: IFC attributes for all the edges.
-            '''
-            for e, name in zip(edges, names):
-                import_edge(e, name, labelName, attributes)
-            
-        def import_wire(wireObj, attributes):
-            ''' Import a wire shape.
-            
-            :param wireObj: shape object containing the wire.
-            :param wireName: name of the wire object.
-            :param objLabel: label of the parent object.
-            :param attributes: IFC attributes for all the edges.
-            '''
-            labelName= wireObj.Label
-            edges= list()
-            names= list()
-            for i, e in enumerate(wireObj.Shape.Edges):
-                edges.append(e)
-                names.append(f'{wireObj.Name}{i}')
-            import_edges(edges, names, labelName, attributes)
+        :param shape: shape of the object.
+        :param pointName: name of the object.
+        :param labelName: label of the object.
+        :param pointAttributes: IFC attributes of the object.
+        '''
+        vertices= [-1]
+        p= self.getRelativeCoo((float(shape.X), float(shape.Y), float(shape.Z)))
+        vertices[0]= self.getIndexNearestPoint(p)
+        self.points[pointName]= vertices
+        properties= bte.BlockProperties(labels= [labelName], attributes= pointAttributes)
+        self.propertyDict[pointName]= properties
 
-        for obj in self.groupsToImport:
-            if(hasattr(obj,'Shape')):
-                shapeType= obj.Shape.ShapeType
-                labelName= obj.Label
-                attributes= get_ifc_attributes(obj)
-                if(shapeType=='Wire'):
-                    import_wire(obj, attributes)
-                elif(shapeType=='Compound'):
-                    for cCount, ss in enumerate(obj.Shape.SubShapes):
-                        ssType= ss.ShapeType
-                        ssName= f'{obj.Name}.{cCount}'
-                        edges= ss.Edges
-                        names= list()
-                        for i in range(0,len(edges)):
-                            names.append(ssName+'.'+str(i))
-                        import_edges(edges, names, labelName+'.'+ssName, attributes)
-                elif(shapeType=='Edge'):
-                    className= type(self).__name__
-                    methodName= sys._getframe(0).f_code.co_name
-                    lmsg.warning(className+'.'+methodName+'; entity with shape of type: '+shapeType+' not imported yet (promote it into "Line" if you want it to be imported).')
-
-                        
-    def importFaces(self):
-        ''' Import faces from FreeCAD file.'''
-        self.facesTree= dict()
-        for obj in self.groupsToImport:
-            self.facesTree[obj.Label]= dict()
-
-        def import_face(faceShape, faceName, objLabel):
-            ''' Add the face argument to the dictionary.'''
-            objPoints= list()
-            for wire in faceShape.Wires:
-                wirePoints= list()
-                for v in wire.OrderedVertexes:                    
-                    wirePoints.append([float(v.X), float(v.Y), float(v.Z)])
-                objPoints.append(wirePoints)
-            vertices= list()
-            for wirePoints in objPoints:
-                wireVertices= list()
-                for pt in wirePoints:
-                    p= self.getRelativeCoo(pt)
-                    idx= self.getIndexNearestPoint(p)
-                    wireVertices.append(idx)
-                vertices.append(wireVertices)
-            # Outer wire.
-            facesDict[faceName]= vertices[0]
-            faceAttributes= get_ifc_attributes(obj)
-            faceAttributes.update({'name':faceName})
-            # Inner wire(s).
-            holes= list()
-            for idx, wire in enumerate(vertices[1:]):
-                holeName= faceName+'_hole'+str(idx)
-                facesDict[holeName]= wire
-                holeAttributes= get_ifc_attributes(obj)
-                holeAttributes.update({'objType':'hole', 'ownerName':faceName})
-                holeProperties= bte.BlockProperties(labels= [objLabel], attributes= holeAttributes)
-                self.propertyDict[holeName]= holeProperties
-                holes.append(holeName)
-            if(len(holes)>0):
-                faceAttributes.update({'holeNames':holes})
-            properties= bte.BlockProperties(labels= [objLabel], attributes= faceAttributes)
-            self.propertyDict[faceName]= properties
-            
-
-        def import_shell(shapeContainer, faceName, objLabel):
-            ''' Import shell objects from the container argument.'''
-            for fCount, f in enumerate(shapeContainer):
-                thisFaceName= f'{faceName}.{fCount}'
-                import_face(f, thisFaceName, objLabel)
-
-        def import_shape(shape, objName, objLabel):
-            ''' Import simple shape.'''
-            shapeType= shape.ShapeType
-            if(shapeType=='Face'):
-                import_face(shape, objName, objLabel)
-            elif(shapeType=='Shell'):
-                for s in shape.SubShapes:
-                    import_shape(s, objName, objLabel)
-            elif(shapeType=='Compound'):
-                for cCount, ss in enumerate(shape.SubShapes):
-                    ssType= ss.ShapeType
-                    ssName= f'{objName}.{cCount}'
-                    import_shape(ss, ssName, objLabel)
-            elif(shapeType=='Vertex'):
-                count=0 # Nothing to do with those here.
-            elif(shapeType in ['Wire']):
-                count= 0 # Nothing to do with those.
-            else:
-                className= type(self).__name__
-                methodName= sys._getframe(0).f_code.co_name
-                lmsg.warning(className+'.'+methodName+'; entity with shape of type: '+shapeType+' ignored.')
+    def importEdge(self, p1, p2, idx0, idx1, edgeName, labelName, edgeAttributes):
+        ''' Import an edge.
 
-        for obj in self.groupsToImport:
-            if(hasattr(obj,'Shape')):
-                shapeType= obj.Shape.ShapeType
-                objName= obj.Name
-                objLabel= obj.Label
-                if(objLabel in self.facesTree):
-                    facesDict= self.facesTree[objLabel]
-                    import_shape(obj.Shape, objName, objLabel)
-                    # Store compound components.
-                    if(shapeType=='Compound'):
-                        objTypeId= obj.TypeId
-                        compoundContainer= None
-                        if(objTypeId=='App::DocumentObjectGroup'): # Object group.
-                            compoundContainer= obj.Group
-                            compoundType= 'Group'
-                        #draftType= getType(obj)
-                        elif(objTypeId!='Part::FeaturePython'):
-                            compoundContainer= obj.Links
-                            compoundType= 'Compound'
-                        if(compoundContainer):
-                            for tag, lnk in enumerate(compoundContainer):
-                                componentLabel= obj.Label+'.'+compoundType+'.'+str(tag)
-                                if(componentLabel in self.compounds):
-                                    self.compounds[componentLabel].add({objLabel})
-                                else:
-                                    self.compounds[componentLabel]= {objLabel}
-        # Define belongsTo attribute for compounds components. 
-        for key in self.propertyDict:
-            pDict= self.propertyDict[key]
+        :param p1: relative coordinates of the edge first vertex.
+        :param p2: relative coordinates of the edge second vertex.
+        :param idx0: index of the k-point nearest to p1.
+        :param idx1: index of the k-point nearest to p2.
+        :param edgeName: name of the edge object.
+        :param labelName: label of the parent object.
+        :param edgeAttributes: IFC attributes of the parent object.
+        '''
+        vertices= [-1,-1]
+        dx= p1[0]-p2[0]; dy= p1[1]-p2[1]; dz= p1[2]-p2[2]
+        length= math.sqrt(dx*dx+dy*dy+dz*dz)
+        # Try to have all lines with the
+        # same orientation.
+        idx0, idx1= self.getIndexesOrientation(idx0, idx1, length/1e4)
+        # end orientation.
+        vertices[0]= idx0
+        vertices[1]= idx1
+        if(vertices[0]==vertices[1]):
+            lmsg.error(f'Error in line {edgeName} vertices are equal: {vertices}')
+        if(length>self.threshold):
+            self.lines[edgeName]= vertices
+            objLabels= [labelName]
+            # # groups
+            # if(edgeName in self.entitiesGroups):
+            #     objLabels.extend(self.entitiesGroups[edgeName])
+            self.propertyDict[edgeName]= bte.BlockProperties(labels= objLabels, attributes= edgeAttributes)
+        else:
+            lmsg.error(f'line too short: {p1},{p2}, {length}')
+
+    def importEdges(self, edges, names, labelName, attributes):
+        ''' Import edges from a wire shape.
+
+        :param edges: edge list.
+        :param names: list containing the names of the edges.
+        :param labelName: label of the parent object.
+        :param attributes: IFC attributes for all the edges.
+        '''
+        # Compute the relative coordinates of the edge ends.
+        endPoints= np.empty((2*len(edges), 3), dtype= float)
+        for i, e in enumerate(edges):
+            v0, v1= e.Vertexes[:2]
+            j= 2*i
+            endPoints[j]= (v0.X, v0.Y, v0.Z)
+            endPoints[j+1]= (v1.X, v1.Y, v1.Z)
+        endPoints= self.getRelativeCoos(endPoints)
+        # Search the nearest k-points for all of them at once.
+        indexes= self.getIndexesNearestPoints(endPoints)
+        if(isinstance(endPoints, np.ndarray)):
+            endPoints= endPoints.tolist()
+        for i, name in enumerate(names):
+            j= 2*i
+            self.importEdge(endPoints[j], endPoints[j+1], indexes[j], indexes[j+1], name, labelName, attributes)
+
+    def importObjectLines(self, shape, shapeType, objName, labelName, attributes):
+        ''' Import the lines of the object argument.
+
+        :param shape: shape of the object.
+        :param shapeType: type of the shape.
+        :param objName: name of the object.
+        :param labelName: label of the object.
+        :param attributes: IFC attributes of the object.
+        '''
+        if(shapeType=='Wire'):
+            edges= shape.Edges
+            names= [objName+str(i) for i in range(0,len(edges))]
+            self.importEdges(edges, names, labelName, attributes)
+        elif(shapeType=='Compound'):
+            prefix= objName+'.'
+            for cCount, ss in enumerate(shape.SubShapes):
+                ssName= prefix+str(cCount)
+                edges= ss.Edges
+                ssPrefix= ssName+'.'
+                names= [ssPrefix+str(i) for i in range(0,len(edges))]
+                self.importEdges(edges, names, labelName+'.'+ssName, attributes)
+        elif(shapeType=='Edge'):
+            className= type(self).__name__
+            methodName= sys._getframe(0).f_code.co_name
+            lmsg.warning(className+'.'+methodName+'; entity with shape of type: '+shapeType+' not imported yet (promote it into "Line" if you want it to be imported).')
+
+    def importFace(self, faceShape, faceName, objLabel, facesDict, attributes):
+        ''' Add the face argument to the dictionary.
+
+        :param faceShape: shape of the face.
+        :param faceName: name of the face.
+        :param objLabel: label of the owner object.
+        :param facesDict: dictionary to store the face in.
+        :param attributes: IFC attributes of the owner object.
+        '''
+        vertices= list()
+        for wire in faceShape.Wires:
+            orderedVertexes= wire.OrderedVertexes
+            numVertexes= len(orderedVertexes)
+            wirePoints= np.fromiter((c for v in orderedVertexes for c in (v.X, v.Y, v.Z)), dtype= float, count= 3*numVertexes).reshape(numVertexes, 3)
+            relativePoints= self.getRelativeCoos(wirePoints)
+            vertices.append(self.getIndexesNearestPoints(relativePoints))
+        # Outer wire.
+        facesDict[faceName]= vertices[0]
+        faceAttributes= dict(attributes)
+        faceAttributes.update({'name':faceName})
+        # Inner wire(s).
+        holes= list()
+        holePrefix= faceName+'_hole'
+        for idx, wire in enumerate(vertices[1:]):
+            holeName= holePrefix+str(idx)
+            facesDict[holeName]= wire
+            holeAttributes= dict(attributes)
+            holeAttributes.update({'objType':'hole', 'ownerName':faceName})
+            holeProperties= bte.BlockProperties(labels= [objLabel], attributes= holeAttributes)
+            self.propertyDict[holeName]= holeProperties
+            holes.append(holeName)
+        if(len(holes)>0):
+            faceAttributes.update({'holeNames':holes})
+        properties= bte.BlockProperties(labels= [objLabel], attributes= faceAttributes)
+        self.propertyDict[faceName]= properties
+
+    def importShell(self, shapeContainer, faceName, objLabel, facesDict, attributes):
+        ''' Import shell objects from the container argument.'''
+        prefix= faceName+'.'
+        for fCount, f in enumerate(shapeContainer):
+            thisFaceName= prefix+str(fCount)
+            self.importFace(f, thisFaceName, objLabel, facesDict, attributes)
+
+    def importShape(self, shape, objName, objLabel, facesDict, attributes):
+        ''' Import simple shape.
+
+        :param shape: shape to import.
+        :param objName: name of the shape.
+        :param objLabel: label of the owner object.
+        :param facesDict: dictionary to store the faces in.
+        :param attributes: IFC attributes of the owner object.
+        '''
+        shapeType= shape.ShapeType
+        if(shapeType in _NOOP_SHAPES):
+            return
+        handler= _SHAPE_HANDLERS.get(shapeType)
+        if(handler is not None):
+            handler(self, shape, objName, objLabel, facesDict, attributes)
+        else:
+            className= type(self).__name__
+            methodName= sys._getframe(0).f_code.co_name
+            lmsg.warning(className+'.'+methodName+'; entity with shape of type: '+shapeType+' ignored.')
+
+    def importObjectFaces(self, obj, shape, shapeType, objName, objLabel, attributes):
+        ''' Import the faces of the object argument.
+
+        :param obj: FreeCAD object to import.
+        :param shape: shape of the object.
+        :param shapeType: type of the shape.
+        :param objName: name of the object.
+        :param objLabel: label of the object.
+        :param attributes: IFC attributes of the object.
+        '''
+        if(objLabel in self.facesTree):
+            facesDict= self.facesTree[objLabel]
+            self.importShape(shape, objName, objLabel, facesDict, attributes)
+            # Store compound components.
+            if(shapeType=='Compound'):
+                objTypeId= obj.TypeId
+                compoundContainer= None
+                if(objTypeId=='App::DocumentObjectGroup'): # Object group.
+                    compoundContainer= obj.Group
+                    compoundType= 'Group'
+                #draftType= getType(obj)
+                elif(objTypeId!='Part::FeaturePython'):
+                    compoundContainer= obj.Links
+                    compoundType= 'Compound'
+                if(compoundContainer):
+                    prefix= objLabel+'.'+compoundType+'.'
+                    for tag, lnk in enumerate(compoundContainer):
+                        componentLabel= prefix+str(tag)
+                        if(componentLabel in self.compounds):
+                            self.compounds[componentLabel].add({objLabel})
+                        else:
+                            self.compounds[componentLabel]= {objLabel}
+
+    def setCompoundsMembership(self):
+        ''' Define belongsTo attribute for compounds components.'''
+        if(not self.compounds): # no compounds, nothing to do.
+            return
+        # Index the properties by compound label.
+        affected= dict()
+        compounds= self.compounds
+        for key, pDict in self.propertyDict.items():
             for label in pDict.labels:
-                if label in self.compounds:
-                    compound= list(self.compounds[label])
-                    if('belongsTo' in pDict.attributes):
-                        pDict.attributes['belongsTo'].extend(compound)
-                    else:
-                        pDict.attributes['belongsTo']= compound
+                if label in compounds:
+                    affected.setdefault(label, list()).append(key)
+        for label, keys in affected.items():
+            compound= list(compounds[label])
+            for key in keys:
+                self.propertyDict[key].attributes.setdefault('belongsTo', list()).extend(compound)
               
     def getNamesToImport(self):
         ''' Return the names of the objects to import.'''
@@ -14,6 +14,8 @@ import re
 import sys
 import datetime
 import math
+import numpy as np
+from scipy.spatial import cKDTree
 from scipy.spatial.distance import cdist
 from misc_utils import log_messages as lmsg
 from import_export import block_topology_entities as bte
@@ -30,6 +32,18 @@ def nameToImport(testName,namesToImport):
             return True
     return False
 
+def argminSqDist(pts, pt):
+    ''' Return the index of the row of pts nearest to pt and its squared
+        distance to pt.
+
+    :param pts: (n,3) array of point coordinates.
+    :param pt: point coordinates.
+    '''
+    d= pts-pt
+    d2= np.einsum('ij,ij->i', d, d)
+    i= int(d2.argmin())
+    return i, d2[i]
+
 class ReaderBase(object):
     '''Base class for DXF and FreeCAD readers.
 
@@ -45,6 +59,11 @@ class ReaderBase(object):
      :ivar propertyDict: dictionary that relies each object name with its properties (labels and attributes).
      :ivar lines: dictionary storing the imported lines.
      :ivar facesTree: dictionary storing the imported faces.
+     :ivar kPointsArray: (n,3) array with the coordinates of the k-points
+                         (self.kPoints contains the same values as
+                         a list).
+     :ivar kPointsTree: k-d tree used to search the nearest k-point (built
+                        once the k-points are selected).
     '''
     def __init__(self,fileName, getRelativeCoo, threshold= 0.01, importLines= True, importSurfaces= True):
         ''' Constructor.
@@ -67,9 +86,73 @@ class ReaderBase(object):
         self.propertyDict= dict()
         self.lines= dict()
         self.facesTree= dict()
+        self.kPointsArray= None
+        self.kPointsTree= None
+        self.relativeCooTransform= self.getRelativeCooTransform()
+
+    def getRelativeCooTransform(self):
+        ''' Return the matrix and the translation vector (R, t) of the
+            getRelativeCoo transformation if it is affine (so
+            getRelativeCoo(p)= R*p+t), otherwise return None.
+        '''
+        retval= None
+        try:
+            t= np.asarray(self.getRelativeCoo([0.0, 0.0, 0.0]), dtype= float)
+            R= np.column_stack([np.asarray(self.getRelativeCoo(list(e)), dtype= float)-t for e in np.eye(3)])
+            # Check that the transformation is really affine (non-integer
+            # test points, so roundings are not taken as affine maps).
+            testPoints= [[math.sqrt(2), math.pi, math.e], [-7.0*math.sqrt(3), 5.0+math.sqrt(5), 11.0/math.pi]]
+            affine= True
+            for p in testPoints:
+                q= np.asarray(self.getRelativeCoo(p), dtype= float)
+                if(not np.allclose(q, R @ p + t, rtol= 1e-9, atol= 1e-9)):
+                    affine= False
+                    break
+            if(affine):
+                retval= (R, t)
+        except Exception:
+            retval= None # can't decompose, use the function itself.
+        return retval
+
+    def getRelativeCoos(self, pts):
+        ''' Apply the getRelativeCoo transformation to all the points of
+            the argument.
+
+        :param pts: list or (n,3) array of point coordinates (if
+                    it's an array and the transformation is affine
+                    an array is returned).
+        '''
+        if(self.relativeCooTransform is None or len(pts)==0):
+            return [self.getRelativeCoo(p) for p in pts]
+        else:
+            R, t= self.relativeCooTransform
+            retval= np.asarray(pts, dtype= float) @ R.T + t
+            if(not isinstance(pts, np.ndarray)):
+                retval= retval.tolist()
+            return retval
 
     def getIndexNearestPoint(self, pt):
-        return cdist([pt], self.kPoints).argmin()
+        ''' Return the index of the k-point nearest to the argument.
+
+        :param pt: point coordinates.
+        '''
+        if(self.kPointsTree is not None):
+            return self.kPointsTree.query(pt)[1]
+        else: # k-points still being selected.
+            return cdist([pt], self.kPoints).argmin()
+
+    def getIndexesNearestPoints(self, pts):
+        ''' Return the indexes of the k-points nearest to each of the
+            points of the argument.
+
+        :param pts: list of point coordinates.
+        '''
+        if(len(pts)==0):
+            return list()
+        if(self.kPointsTree is not None):
+            return self.kPointsTree.query(np.asarray(pts, dtype= float))[1].tolist()
+        else: # k-points still being selected.
+            return cdist(pts, self.kPoints).argmin(axis= 1).tolist()
 
     def getNearestPoint(self, pt):
         return self.kPoints[self.getIndexNearestPoint(pt)]
@@ -124,6 +207,16 @@ class ReaderBase(object):
         '''
         idx0= self.getIndexNearestPoint(p0)
         idx1= self.getIndexNearestPoint(p1)
+        return self.getIndexesOrientation(idx0, idx1, tol)
+    
+    def getIndexesOrientation(self, idx0, idx1, tol):
+        ''' Return the k-points indexes in the order that makes the resulting
+            vector to point outwards the origin.
+
+        :param idx0: index of the first k-point.
+        :param idx1: index of the second k-point.
+        :param tol: tolerance to consider that two coordinates are equal.
+        '''
         v0= self.kPoints[idx0]
         v1= self.kPoints[idx1]
         deltas= [abs(v0[0]-v1[0]), abs(v0[1]-v1[1]), abs(v0[2]-v1[2])]
@@ -146,10 +239,15 @@ class ReaderBase(object):
         points, properties= self.extractPoints()
         indexDict= None
         keys= list(points.keys())
+        self.kPointsTree= None
         if(len(keys)>0):
+            # Contiguous storage for the k-points found so far.
+            kPointsArray= np.empty((len(keys), 3), dtype= float)
+            threshold2= self.threshold**2
             # Append first point
             pointName= keys[0]
-            self.kPoints= [points[pointName]]
+            kPointsArray[0]= points[pointName]
+            numKPoints= 1
             objProperties= properties[pointName]
             self.propertyDict[pointName]= objProperties
             indexDict= dict()
@@ -158,17 +256,19 @@ class ReaderBase(object):
             for pointName in keys[1:]:
                 p= points[pointName]
                 objProperties= properties[pointName]
-                indexNearestPoint= self.getIndexNearestPoint(p)
-                nearestPoint= self.kPoints[indexNearestPoint]
-                dist= cdist([p],[nearestPoint])[0][0]
-                if(dist>self.threshold): # new point.
-                    indexNearestPoint= len(self.kPoints) # The point itself.
-                    self.kPoints.append(p)
+                indexNearestPoint, dist2= argminSqDist(kPointsArray[:numKPoints], p)
+                if(dist2>threshold2): # new point.
+                    indexNearestPoint= numKPoints # The point itself.
+                    kPointsArray[numKPoints]= p
+                    numKPoints+= 1
                     self.propertyDict[pointName]= objProperties
                     indexDict[indexNearestPoint]= pointName
                 else:
                     pointName= indexDict[indexNearestPoint]
                     self.propertyDict[pointName].extend(objProperties)
+            self.kPointsArray= kPointsArray[:numKPoints].copy()
+            self.kPoints= self.kPointsArray.tolist()
+            self.kPointsTree= cKDTree(self.kPointsArray)
         else:
             lmsg.warning('No points in :'+self.fileName+' file.')
         return indexDict
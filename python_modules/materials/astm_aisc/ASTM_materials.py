@@ -16,6 +16,7 @@ __email__= "l.pereztato@ciccp.es, ana.ortega@ciccp.es "
 
 import inspect
 import sys
+import importlib
 import math
 import scipy.interpolate
 import geom
@@ -75,6 +76,7 @@ class ASTMSteel(steel_base.BasicSteel):
 
     def setFromDict(self,dct):
         ''' Read member values from a dictionary.'''
+        super(ASTMSteel,self).setFromDict(dct)
         self.name= None
         if('name' in dct):
             name= dct['name']
@@ -412,8 +414,9 @@ class BoltFastener(bolts.BoltBase):
     def setFromDict(self,dct):
         ''' Read member values from a dictionary.'''
         super(BoltFastener,self).setFromDict(dct)
-        steelTypeClassName= dct['steelTypeClassName']+'()'
-        self.steelType= eval(steelTypeClassName)
+        moduleName, className= dct['steelTypeClassName'].rsplit('.', 1)
+        steelTypeClass= getattr(importlib.import_module(moduleName), className)
+        self.steelType= steelTypeClass()
         self.steelType.setFromDict(dct['steelType'])
 
     def report(self, outputFile):
@@ -478,6 +481,8 @@ def getBoltForHole(holeDiameter, boltSteelType= A307, tol= 0.5e-3):
 
 class BoltArray(bp.BoltArrayBase):
     ''' Bolt array the AISC/ASTM way.'''
+    __slots__= ()
+    
     def __init__(self, bolt= M16, nRows= 1, nCols= 1, dist= None):
         ''' Constructor.
 
@@ -908,8 +913,9 @@ class AnchorBolt(bolts.AnchorBase):
         ''' Read member values from a dictionary.'''
         super(AnchorBolt, self).setFromDict(dct)
         self.name= dct['name']
-        steelTypeClassName= dct['steelTypeClassName']+'()'
-        self.steelType= eval(steelTypeClassName)
+        moduleName, className= dct['steelTypeClassName'].rsplit('.', 1)
+        steelTypeClass= getattr(importlib.import_module(moduleName), className)
+        self.steelType= steelTypeClass()
         self.steelType.setFromDict(dct['steelType'])
 
     def getNumOfThreadsPerInch(self):
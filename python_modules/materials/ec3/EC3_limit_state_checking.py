@@ -74,9 +74,10 @@ def getMvRdz(steelShape,sectionClass,Vd):
     if(reductionCoeff<=0.0):
         return McRdz
     else:
-        Aw= steelShape.hw()*steelShape.tw()
-        sustr= reductionCoeff*Aw**2/4.0/steelShape.tw()
-        return min((steelShape.getWz(sectionClass)-sustr)*steelShape.steelType.fy/steelShape.steelType.gammaM0(),McRdz)
+        tw= steelShape.tw()
+        Aw= steelShape.hw()*tw
+        sustr= reductionCoeff*Aw**2/4.0/tw
+        return min((steelShape.getWz(sectionClass)-sustr)*steelShape.steelType.fyd(),McRdz)
 
 def getLateralBucklingImperfectionFactor(steelShape):
     ''' Returns lateral torsional imperfection factor depending of the type of section 
@@ -132,7 +133,7 @@ def getLateralBucklingIntermediateFactor(steelShape,sectionClass,L,Mi,supportCoe
     '''
     alphaLT= steelShape.getLateralBucklingImperfectionFactor()
     overlineLambdaLT= steelShape.getLateralBucklingNonDimensionalBeamSlenderness(sectionClass,L,Mi,supportCoefs)
-    return 0.5*(1+alphaLT*(overlineLambdaLT-0.2)+overlineLambdaLT**2)
+    return _ltb_intermediate_factor(alphaLT, overlineLambdaLT)
 
 def getLateralBucklingReductionFactor(steelShape,sectionClass,L,Mi,supportCoefs= SupportCoefficients()):
     ''' Returns lateral torsional buckling reduction factor value.
@@ -142,9 +143,11 @@ def getLateralBucklingReductionFactor(steelShape,sectionClass,L,Mi,supportCoefs=
     :param Mi: ordinate for the moment diagram
     :param supportCoefs: coefficients that represent support conditions.
     '''  
-    phiLT= steelShape.getLateralBucklingIntermediateFactor(sectionClass,L,Mi,supportCoefs)
+    # compute the slenderness (and so Mcr) only once.
+    alphaLT= steelShape.getLateralBucklingImperfectionFactor()
     overlineLambdaLT= steelShape.getLateralBucklingNonDimensionalBeamSlenderness(sectionClass,L,Mi,supportCoefs)
-    return min(1.0,1.0/(phiLT+math.sqrt(phiLT**2-overlineLambdaLT**2)))
+    phiLT= _ltb_intermediate_factor(alphaLT, overlineLambdaLT)
+    return _ltb_reduction_factor(phiLT, overlineLambdaLT)
 
 def getLateralTorsionalBucklingResistance(steelShape,sectionClass,L,Mi,supportCoefs= SupportCoefficients()):
     '''Returns lateral torsional buckling resistance of this cross-section.
@@ -178,24 +181,44 @@ def getMcr(steelShape,L,Mi,supportCoefs= SupportCoefficients()):
     '''
     mgf= MomentGradientFactorC1(Mi)
     C1= mgf.getC1(supportCoefs)
-    pi2EIy= math.pi**2*steelShape.EIy()
-    GIt= steelShape.GJ()
-    kyL2= (supportCoefs.ky*L)**2
-    Mcr0= pi2EIy/kyL2
-    sum1= (supportCoefs.ky/supportCoefs.kw)**2*steelShape.Iw()/steelShape.Iy()
+    return _mcr_kernel(C1, steelShape.EIy(), steelShape.GJ(), steelShape.Iw(), steelShape.Iy(), L, supportCoefs.ky, supportCoefs.kw)
+
+def _mcr_kernel(C1, EIy, GIt, Iw, Iy, L, ky, kw):
+    '''Return the elastic critical moment (see getMcr) from the scalar 
+       values it depends on.
+
+    :param C1: moment gradient factor.
+    :param EIy: bending stiffness about the minor axis.
+    :param GIt: torsional stiffness.
+    :param Iw: warping constant.
+    :param Iy: moment of inertia about the minor axis.
+    :param L: member length.
+    :param ky: lateral bending coefficient.
+    :param kw: warping coefficient.
+    '''
+    kyL2= (ky*L)**2
+    Mcr0= math.pi**2*EIy/kyL2
+    sum1= (ky/kw)**2*Iw/Iy
     sum2= GIt/Mcr0
     f2= math.sqrt(sum1+sum2)
-    # print('  L= ', L)
-    # print('  kyL2= ', kyL2)
-    # print('  GJ= ', GIt/1e3)
-    # print('  Iw= ', steelShape.Iw()*100**6, ' cm^6')
-    # print('  C1= ', C1)
-    # print('  Mcr0=', Mcr0/1e3  )
-    # print('  sum1= ', sum1)
-    # print('  sum2= ', sum2)
-    # print('  f2= ', f2)
     return C1*Mcr0*f2
 
+def _ltb_intermediate_factor(alphaLT, overlineLambdaLT):
+    '''Return the lateral torsional buckling intermediate factor phiLT.
+
+    :param alphaLT: imperfection factor.
+    :param overlineLambdaLT: non dimensional beam slenderness.
+    '''
+    return 0.5*(1+alphaLT*(overlineLambdaLT-0.2)+overlineLambdaLT**2)
+
+def _ltb_reduction_factor(phiLT, overlineLambdaLT):
+    '''Return the lateral torsional buckling reduction factor chiLT.
+
+    :param phiLT: intermediate factor.
+    :param overlineLambdaLT: non dimensional beam slenderness.
+    '''
+    return min(1.0,1.0/(phiLT+math.sqrt(phiLT**2-overlineLambdaLT**2)))
+
 def getLateralBucklingNonDimensionalBeamSlenderness(steelShape,sectionClass,L,Mi,supportCoefs= SupportCoefficients()):
     '''Returns non dimensional beam slenderness
     for lateral torsional buckling
@@ -330,24 +353,23 @@ class ShearController(lsc.LimitStateControllerBase2Sections):
 
 # Routines to install in recorder  to execute in every commit to check
 # eurocode-3 criterions.
+# The check...ForElement methods of the cross-section call
+# getResistingForce() themselves, so the code below doesn't.
 
 def controlBiaxialBendingEfficiency():
   '''Code to execute in every commit to check stress criterion (bars in 3D problems).'''
   return '''nmbComb= recorder.getCurrentCombinationName
-self.getResistingForce()
 crossSection= self.getProp('crossSection')
 crossSection.checkBiaxialBendingForElement(self,nmbComb)'''
 
 def controlYShearEfficiency():
   return '''nmbComb= recorder.getCurrentCombinationName
-self.getResistingForce()
 crossSection= self.getProp('crossSection')
 crossSection.checkYShearForElement(self,nmbComb)'''
 
 def controlULSCriterion():
   return '''recorder= self.getProp('ULSControlRecorder')
 nmbComb= recorder.getCurrentCombinationName
-self.getResistingForce()
 crossSection= self.getProp('crossSection')
 crossSection.checkBiaxialBendingForElement(self,nmbComb)
 crossSection.checkYShearForElement(self,nmbComb)'''
@@ -355,7 +377,6 @@ crossSection.checkYShearForElement(self,nmbComb)'''
 def controlULSCriterion2D():
   return '''recorder= self.getProp('ULSControlRecorder')
 nmbComb= recorder.getCurrentCombinationName
-self.getResistingForce()
 crossSection= self.getProp('crossSection')
 crossSection.checkUniaxialBendingForElement(self,nmbComb)
 crossSection.checkYShearForElement(self,nmbComb)'''
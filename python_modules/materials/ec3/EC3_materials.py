@@ -11,12 +11,17 @@ __version__= "3.0"
 __email__= " ana.Ortega.Ort@gmail.com, l.pereztato@gmail.com"
 
 import math
+from bisect import bisect_left
+import numpy as np
 from materials import steel_base
 from materials import typical_materials
 from materials.ec3 import EC3_limit_state_checking as EC3lsc
 from misc_utils import log_messages as lmsg
 from materials.sections import structural_steel
 
+_SQRT3= math.sqrt(3.0)
+_INV_SQRT3= 1.0/_SQRT3
+
 class EC3Steel(steel_base.BasicSteel):
     '''Eurocode 3 structural steel.
 
@@ -51,6 +56,9 @@ class EC3Steel(steel_base.BasicSteel):
         self.fy125= fy125
         self.gammaM1= gammaM1 #Partial factor for buckling resistance.
         self.gammaM2= gammaM2 #Partial factor for cross-sections in tension to fracture.
+        self._lambda1= None # cached (E, fy, lambda1) values.
+        self._eps= None # cached (fy, eps) values.
+        self._fyd= None # cached (fy, gammaM, fyd, fydV) values.
 
     def gammaM0(self):
         ''' Return the value of the partial safety factor for steel strength.'''
@@ -62,19 +70,56 @@ class EC3Steel(steel_base.BasicSteel):
         :param gammaM0: Partial safety factor for steel strength.
         '''
         self.gammaM= gammaM0
+        self._fyd= None
+
+    def _getDesignStrengths(self):
+        ''' Return the cached (fy, gammaM, fyd, fydV) tuple, computing it
+            again if the yield strength or the partial safety factor have
+            changed.'''
+        cached= self._fyd
+        if((cached is None) or (cached[0]!=self.fy) or (cached[1]!=self.gammaM)):
+            fyd= self.fy/self.gammaM
+            cached= (self.fy, self.gammaM, fyd, fyd*_INV_SQRT3)
+            self._fyd= cached
+        return cached
+
+    def fyd(self):
+        ''' Return the design value of the yield strength.'''
+        return self._getDesignStrengths()[2]
 
     def fydV(self):
         ''' Return the design value of the shear strength.'''
-        return self.fyd()/math.sqrt(3)
+        return self._getDesignStrengths()[3]
 
     def getLambda1(self):
         '''return lambda_1 value as specified in EC3 part 1 5.5.1.2
         '''
-        return math.pi*math.sqrt(self.E/self.fy)
+        cached= self._lambda1
+        if((cached is None) or (cached[0]!=self.E) or (cached[1]!=self.fy)):
+            cached= (self.E, self.fy, math.pi*math.sqrt(self.E/self.fy))
+            self._lambda1= cached
+        return cached[2]
+
+    def getEps(self):
+        '''return the epsilon=sqrt(235/fy) coefficient used to classify
+           the cross-sections (table 5.2 of EC3 part 1).
+        '''
+        cached= self._eps
+        if((cached is None) or (cached[0]!=self.fy)):
+            cached= (self.fy, math.sqrt(235e6/self.fy))
+            self._eps= cached
+        return cached[1]
 
     def getDesignElasticPerfectlyPlasticMaterial(self,preprocessor,name):
         return typical_materials.defElasticPPMaterial(preprocessor, name,self.E,self.fyd(),-self.fyd())
 
+# Steel yield strength (t<40 mm, 40 mm<t<100 mm) for each steel designation
+# (see table 3.1).
+_FY_TABLE= {235:(235e6,215e6), 275:(275e6,255e6), 355:(355e6,335e6)}
+# Steel ultimate strength (t<40 mm, 40 mm<t<100 mm) for each steel designation
+# (see table 3.1).
+_FU_TABLE= {235:(360e6,340e6), 275:(430e6,410e6), 355:(510e6,490e6)}
+
 def fyEC3(desig, t):
     '''
     Return steel yield strength from its name and the part thickness 
@@ -86,18 +131,12 @@ def fyEC3(desig, t):
     '''
     retval= 0.0
     if(t>0.1):
-        methodName= sys._getframe(0).f_code.co_name
-        lmsg.error(methodName+'; part thickness out of range: '+str(t*1000)+' mm.')
-
-    if(desig == 235):
-        retval= ifte(t<40e-3,235e6,215e6)
-    elif(desig == 275):
-        retval= ifte(t<40e-3,275e6,255e6)
-    elif(desig == 355):
-        retval= ifte(t<40e-3,355e6,335e6)
+        lmsg.error('fyEC3; part thickness out of range: '+str(t*1000)+' mm.')
+    values= _FY_TABLE.get(desig)
+    if(values is None):
+        lmsg.error('fyEC3; unknown steel designation: '+str(desig)+'.')
     else:
-        methodName= sys._getframe(0).f_code.co_name
-        lmsg.error(methodName+'; unknown steel designation: '+str(desig)+'.')
+        retval= values[0] if(t<40e-3) else values[1]
     return retval
 
 def fuEC3(desig, t):
@@ -110,28 +149,126 @@ def fuEC3(desig, t):
     '''
     retval= 0.0
     if(t>0.1):
-        methodName= sys._getframe(0).f_code.co_name
-        lmsg.error(methodName+'; part thickness out of range: '+str(t*1000)+' mm.')
-
-    if(desig == 235):
-        retval= ifte(t<40e-3,360e6,340e6)
-    elif(desig == 275):
-        retval= ifte(t<40e-3,430e6,410e6)
-    elif(desig == 355):
-        retval= ifte(t<40e-3,510e6,490e6)
+        lmsg.error('fuEC3; part thickness out of range: '+str(t*1000)+' mm.')
+    values= _FU_TABLE.get(desig)
+    if(values is None):
+        lmsg.error('fuEC3; unknown steel designation: '+str(desig)+'.')
     else:
-        methodName= sys._getframe(0).f_code.co_name
-        lmsg.error(methodName+'; unknown steel designation: '+str(desig)+'.')
+        retval= values[0] if(t<40e-3) else values[1]
     return retval
 
 # European norm EN 10025-2:2004
-S235JR= EC3Steel(fy= 235e6, fy16= 235e6, fy40= 225e6, fy63= 215e6, fy80= 215e6, fy100= 215e6, fy125= 195e6,fu= 360e6,gammaM= 1.1)
+# The steel grades are created on first access (see __getattr__ below).
+_STEEL_GRADES= {
+    'S235JR': lambda: EC3Steel(fy= 235e6, fy16= 235e6, fy40= 225e6, fy63= 215e6, fy80= 215e6, fy100= 215e6, fy125= 195e6,fu= 360e6,gammaM= 1.1),
+    'S275JR': lambda: EC3Steel(fy= 275e6, fy16= 275e6, fy40= 265e6, fy63= 255e6, fy80= 245e6, fy100= 235e6, fy125= 225e6,fu= 360e6,gammaM= 1.1),
+    'S355JR': lambda: EC3Steel(fy= 355e6, fy16= 355e6, fy40= 345e6, fy63= 335e6, fy80= 325e6, fy100= 315e6, fy125= 295e6, fu= 360e6, gammaM= 1.1),
+    'S450J0': lambda: EC3Steel(fy= 450e6, fy16= 450e6, fy40= 430e6, fy63= 410e6, fy80= 390e6, fy100= 380e6, fy125= 380e6, fu= 360e6, gammaM= 1.1)
+    }
+
+def __getattr__(name):
+    ''' Create the steel grade objects (S235JR, S275JR,...) the first time
+        they are accessed (PEP 562); after that they are ordinary module
+        attributes.'''
+    factory= _STEEL_GRADES.get(name)
+    if(factory is None):
+        raise AttributeError('module '+__name__+' has no attribute '+name)
+    retval= factory()
+    globals()[name]= retval
+    return retval
+
+def __dir__():
+    ''' Include the steel grades not yet created in the module attributes.'''
+    return sorted(set(globals()) | set(_STEEL_GRADES))
+
+# Limits of the c/t ratio (divided by eps) for classes 1, 2 and 3
+# (table 5.2 EC3-1-1).
+_LIM_INT_COMP= (33,38,42) # internal compression parts in compression.
+_LIM_INT_BEND= (72,83,124) # internal compression parts in bending.
+_LIM_OUT_COMP= (9,10,14) # outstand flanges in compression.
+_CLASSIFICATION_LIMITS= {'internalCompression': _LIM_INT_COMP, 'internalBending': _LIM_INT_BEND, 'outstandCompression': _LIM_OUT_COMP}
+
+def classifyBatch(ratiosCT, fy, partType= 'internalCompression'):
+    ''' Return the classes (1, 2, 3 or 4) that correspond to each of the
+        c/t ratios of the argument (table 5.2 of EC3-1-1). Vectorized
+        version of the getClass... methods of EC3Shape, intended to
+        classify many parts at once.
+
+    :param ratiosCT: c/t width-to-thickness ratios of the parts.
+    :param fy: steel yield strength (scalar or one value for each ratio).
+    :param partType: 'internalCompression', 'internalBending' or 
+                     'outstandCompression'.
+    '''
+    limits= _CLASSIFICATION_LIMITS.get(partType)
+    if(limits is None):
+        lmsg.error('classifyBatch: unknown part type: '+str(partType))
+        return None
+    eps= np.sqrt(235e6/np.asarray(fy, dtype= float))
+    # number of limits exceeded (class 4 if all of them).
+    return np.searchsorted(limits, np.asarray(ratiosCT, dtype= float)/eps, side= 'left')+1
+
+def _ih_biax_bend_coeffs(n):
+    ''' Return (alpha,beta) for I and H sections (clause 6.2.9 of EC3.1.1).
+
+    :param n: ratio NEd/NplRd.
+    '''
+    return (2, max(1,5*n))
+
+def _ch_biax_bend_coeffs(n):
+    ''' Return (alpha,beta) for circular hollow sections (clause 6.2.9 of EC3.1.1).
+
+    :param n: ratio NEd/NplRd.
+    '''
+    return (2, 2)
 
-S275JR= EC3Steel(fy= 275e6, fy16= 275e6, fy40= 265e6, fy63= 255e6, fy80= 245e6, fy100= 235e6, fy125= 225e6,fu= 360e6,gammaM= 1.1)
+# Constants of the expression alpha= min(6, 1.66/(1-1.13*n^2)) for
+# rectangular hollow sections (clause 6.2.9 of EC3.1.1).
+_RHS_A= 1.66
+_RHS_B= 1.13
+_RHS_ALPHA_MAX= 6.0
 
-S355JR= EC3Steel(fy= 355e6, fy16= 355e6, fy40= 345e6, fy63= 335e6, fy80= 325e6, fy100= 315e6, fy125= 295e6, fu= 360e6, gammaM= 1.1)
+def _rs_biax_bend_coeffs(n):
+    ''' Return (alpha,beta) for rectangular hollow sections (clause 6.2.9 of EC3.1.1).
+
+    :param n: ratio NEd/NplRd.
+    '''
+    denom= abs(1.0-_RHS_B*n*n)
+    # Avoid the division when the result is capped (denom can be zero).
+    if(_RHS_A>=_RHS_ALPHA_MAX*denom):
+        alpha= _RHS_ALPHA_MAX
+    else:
+        alpha= _RHS_A/denom
+    return (alpha, alpha)
 
-S450J0= EC3Steel(fy= 450e6, fy16= 450e6, fy40= 430e6, fy63= 410e6, fy80= 390e6, fy100= 380e6, fy125= 380e6, fu= 360e6, gammaM= 1.1)
+def _other_biax_bend_coeffs(n):
+    ''' Return (alpha,beta) for other sections (conservative).
+
+    :param n: ratio NEd/NplRd.
+    '''
+    return (1, 1)
+
+# Functions that compute the bi-axial bending constants for each family
+# of shapes.
+_BIAX_BEND_COEFFS= {'IH': _ih_biax_bend_coeffs, 'CH': _ch_biax_bend_coeffs, 'RS': _rs_biax_bend_coeffs, 'other': _other_biax_bend_coeffs}
+
+# Name prefixes of the I and H shapes and of the rectangular hollow sections.
+_IH_FAMILY= frozenset(('I','H'))
+_RS_FAMILY= frozenset(('RH','SH'))
+
+def getBiaxBendFamily(name):
+    ''' Return the family of shapes used to compute the bi-axial bending
+        constants ('IH', 'CH', 'RS' or 'other') from the shape name.
+
+    :param name: steel shape name.
+    '''
+    if name[:1] in _IH_FAMILY:
+        return 'IH'
+    elif name[:2] == 'CH':
+        return 'CH'
+    elif name[:2] in _RS_FAMILY:
+        return 'RS'
+    else:
+        return 'other'
 
 class EC3Shape(object):
     '''Steel shape with Eurocode 3 verification routines.
@@ -139,6 +276,7 @@ class EC3Shape(object):
     :ivar name: steel shape name.
     :ivar typo: 'rolled' or 'welded' shape
     '''
+    _family= None # family of shapes for the bi-axial bending constants ('IH', 'CH', 'RS' or 'other').
     def __init__(self,name, typo= 'rolled'):
         '''
           Constructor.
@@ -148,6 +286,28 @@ class EC3Shape(object):
         '''
         self.name=name
         self.typo= typo
+        if(self._family is None): # not defined by the class.
+            self._family= getBiaxBendFamily(name)
+        self._shearBucklingVerificationNeeded= None # cached (fy, value).
+        self._cfact= None # cached C length of the internal part.
+        self._invalidateResistanceCache()
+
+    def _invalidateResistanceCache(self):
+        ''' Forget the resistance values computed until now.'''
+        self._resistanceCache= dict()
+        self._resistanceCacheKey= None
+
+    def _getResistanceCache(self):
+        ''' Return the dictionary that stores the resistance values already
+            computed; it is cleared if the steel (or its strength or 
+            partial safety factor) has changed since they were computed.
+        '''
+        steel= self.steelType
+        key= (id(steel), steel.fy, steel.gammaM)
+        if(key!=self._resistanceCacheKey):
+            self._resistanceCache= dict()
+            self._resistanceCacheKey= key
+        return self._resistanceCache
 
     def getClassInternalPartInCompression(self, ratioCT=None):
         '''Return the cross-section classification of internal part 
@@ -159,12 +319,9 @@ class EC3Shape(object):
         
         '''
         ratioCT=ratioCT if ratioCT is not None else self.widthToThicknessWeb()
-        eps=math.sqrt(235e6/self.steelType.fy)
-        limits=[33*eps,38*eps,42*eps]
-        classif=0
-        while ratioCT>limits[classif]:
-            classif+=1
-        return (classif+1)
+        eps= self.steelType.getEps()
+        # number of limits exceeded (class 4 if all of them).
+        return bisect_left(_LIM_INT_COMP, ratioCT/eps)+1
     
     def getClassInternalPartInBending(self, ratioCT=None):
         '''Return the cross-section classification of internal part 
@@ -175,12 +332,9 @@ class EC3Shape(object):
         
         '''
         ratioCT=ratioCT if ratioCT is not None else self.widthToThicknessWeb()
-        eps=math.sqrt(235e6/self.steelType.fy)
-        limits=[72*eps,83*eps,124*eps]
-        classif=0
-        while ratioCT>limits[classif]:
-            classif+=1
-        return (classif+1)
+        eps= self.steelType.getEps()
+        # number of limits exceeded (class 4 if all of them).
+        return bisect_left(_LIM_INT_BEND, ratioCT/eps)+1
         
         
     # def getClassInternalPartInBending(self):
@@ -210,19 +364,25 @@ class EC3Shape(object):
         
         '''
         ratioCT=ratioCT if ratioCT is not None else self.widthToThicknessFlange()
-        eps=math.sqrt(235e6/self.steelType.fy)
-        limits=[9*eps,10*eps,14*eps]
-        classif=0
-        while ratioCT>limits[classif]:
-            classif+=1
-        return (classif+1)
+        eps= self.steelType.getEps()
+        # number of limits exceeded (class 4 if all of them).
+        return bisect_left(_LIM_OUT_COMP, ratioCT/eps)+1
     
     def getCfactIntPart(self):
         '''Return the C length of internal part in compression used to 
-        classify the cross-section. Table 5.2 EC3-1-1
-        '''
-        if self.name[0] in ['I','H']:
-            C=self.h
+        classify the cross-section. Table 5.2 EC3-1-1 (None if the
+        shape family has no internal part: circular hollow sections are
+        classified using the d/t ratio).
+        '''
+        retval= self._cfact
+        if(retval is None):
+            family= self._family
+            if(family=='IH'):
+                retval= self.d() # web depth between fillets.
+            elif(family=='RS'):
+                retval= self.h()-4*self.t() # same as in widthToThicknessWeb.
+            self._cfact= retval
+        return retval
         
     def getLateralTorsionalBucklingCurve(self):
         ''' Return the lateral torsional bukling curve name (a,b,c or d) depending of the type of section (rolled, welded,...). EC3 Table 6.4, 6.3.2.2(2).'''
@@ -243,24 +403,30 @@ class EC3Shape(object):
         if(majorAxis):
             return retval
         else:
-            className= type(self).__name__
-            methodName= sys._getframe(0).f_code.co_name
-            lmsg.error(className+'.'+methodName+': for minor axis not implemented yet.')
+            lmsg.error(type(self).__name__+'.getShearArea: for minor axis not implemented yet.')
             retval/= 1e3
         return retval
     
     def shearBucklingVerificationNeeded(self):
         '''Return true if shear buckling verification is needed EC3-1-5'''
-        return EC3lsc.shearBucklingVerificationNeeded(self)
+        fy= self.steelType.fy
+        cached= self._shearBucklingVerificationNeeded
+        if((cached is None) or (cached[0]!=fy)):
+            cached= (fy, EC3lsc.shearBucklingVerificationNeeded(self))
+            self._shearBucklingVerificationNeeded= cached
+        return cached[1]
     
     def getVplRdy(self):
         '''Return y direction (web direction) plastic shear resistance
            according to clause 6.2.6 (expression 6.18) of EC3-1-1:2005.'''
         if(self.shearBucklingVerificationNeeded()):
-            className= type(self).__name__
-            methodName= sys._getframe(0).f_code.co_name
-            lmsg.warning(className+'.'+methodName+': section needs shear buckling verification.')
-        return self.getAvy()*(self.steelType.fy/math.sqrt(3))/self.steelType.gammaM0()
+            lmsg.warning(type(self).__name__+'.getVplRdy: section needs shear buckling verification.')
+        cache= self._getResistanceCache()
+        retval= cache.get('VplRdy')
+        if(retval is None):
+            retval= self.getAvy()*self.steelType.fydV()
+            cache['VplRdy']= retval
+        return retval
     
     def getVcRdy(self):
         '''Return y direction (web direction) shear resistance
@@ -278,21 +444,39 @@ class EC3Shape(object):
 
         :param sectionClass: section classification (1,2,3 or 4)
         '''
-        return self.getAeff(sectionClass)*self.steelType.fy/self.steelType.gammaM0()
+        cache= self._getResistanceCache()
+        key= ('NcRd', sectionClass)
+        retval= cache.get(key)
+        if(retval is None):
+            retval= self.getAeff(sectionClass)*self.steelType.fyd()
+            cache[key]= retval
+        return retval
     
     def getMcRdy(self,sectionClass):
         '''Return the minor bending resistance of the cross-section.
 
         :param sectionClass: section classification (1,2,3 or 4)
         '''
-        return self.getWy(sectionClass)*self.steelType.fy/self.steelType.gammaM0()
+        cache= self._getResistanceCache()
+        key= ('McRdy', sectionClass)
+        retval= cache.get(key)
+        if(retval is None):
+            retval= self.getWy(sectionClass)*self.steelType.fyd()
+            cache[key]= retval
+        return retval
     
     def getMcRdz(self,sectionClass):
         '''Return the major bending resistance of the cross-section.
 
         :param sectionClass: section classification (1,2,3 or 4)
         '''
-        return self.getWz(sectionClass)*self.steelType.fy/self.steelType.gammaM0()
+        cache= self._getResistanceCache()
+        key= ('McRdz', sectionClass)
+        retval= cache.get(key)
+        if(retval is None):
+            retval= self.getWz(sectionClass)*self.steelType.fyd()
+            cache[key]= retval
+        return retval
     
     def getMvRdz(self,sectionClass,Vd):
         '''Return the major bending resistance of the cross-section under a
@@ -386,9 +570,7 @@ class EC3Shape(object):
         :param sectionClass: section classification (1,2,3 or 4)
         '''
         if(Nd!=0.0):
-            className= type(self).__name__
-            methodName= sys._getframe(0).f_code.co_name
-            lmsg.error(className+'.'+methodName+': for compressed sections not implemented yet.')
+            lmsg.error(type(self).__name__+'.getZBendingEfficiency: for compressed sections not implemented yet.')
         MvRdz= self.getMvRdz(sectionClass,Vyd)
         MbRdz= chiLT*MvRdz #Lateral buckling reduction.
         return abs(Mzd)/MbRdz
@@ -398,19 +580,7 @@ class EC3Shape(object):
         (clause 6.2.9 of EC3.1.1)
         '''
         n= NEd/NplRd
-        if self.name[0] in ['I','H']:
-            alpha=2
-            beta=max(1,5*n)
-        elif self.name[:2] == 'CH':
-            alpha=2
-            beta=2
-        elif self.name[:2] in ['RH','SH']:
-            alpha=min(6,abs(1.66/(1-1.13*n**2)))
-            beta=alpha
-        else:  #conservative
-            alpha=1
-            beta=1
-        return (alpha,beta)
+        return _BIAX_BEND_COEFFS[self._family](n)
     
     def getBiaxialBendingEfficiency(self,sectionClass,Nd,Myd,Mzd,Vyd= 0.0,chiLT=1.0):
         '''Return biaxial bending efficiency (clause 6.2.9 of EC3.1.1)
@@ -437,10 +607,12 @@ class EC3Shape(object):
         :param chiLT: lateral buckling reduction factor (default= 1.0).
         '''
         super(EC3Shape,self).setupULSControlVars(elems)
+        crossSection= self
         for e in elems:
-            e.setProp('sectionClass',sectionClass) #Cross section class.
-            e.setProp('chiLT',chiLT) #Lateral torsional buckling reduction factor.
-            e.setProp('crossSection',self)
+            setProp= e.setProp # look up the bound method only once.
+            setProp('sectionClass',sectionClass) #Cross section class.
+            setProp('chiLT',chiLT) #Lateral torsional buckling reduction factor.
+            setProp('crossSection',crossSection)
 
     def installULSControlRecorder(self, recorderType, elems, sectionClass= 1, chiLT=1.0, calcSet= None):
         '''Installs recorder for verification of ULS criterion. Preprocessor obtained from the set of elements.
@@ -491,42 +663,36 @@ So:
 '''
 
 from materials.sections.structural_shapes import arcelor_metric_shapes
+from materials.sections.structural_shapes import bs_en_10210_shapes
+from materials.sections.structural_shapes import bs_en_10219_shapes
 
-
-class IPNShape(EC3Shape,arcelor_metric_shapes.IPNShape):
-    """IPN shape with Eurocode 3 verification routines."""
-    def __init__(self, steel, name):
-        ''' Constructor.
-
-        :param steel: steel material.
-        :param name: shape name (i.e. IPN_160)
-        '''
-        super(IPNShape, self).__init__(name= name, typo= 'rolled')
-        arcelor_metric_shapes.IPNShape.__init__(self,steel,name)
-
-
-class IPEShape(EC3Shape,arcelor_metric_shapes.IPEShape):
-    '''IPE shape with Eurocode 3 verification routines.'''
+def _make_ec3_shape(baseClass, doc, nameExample, typo= 'rolled', family= None):
+    ''' Return a class that adds the Eurocode 3 verification routines
+        to the shape class argument.
+
+    :param baseClass: shape class to extend (i.e. arcelor_metric_shapes.IPNShape).
+    :param doc: docstring of the new class.
+    :param nameExample: example of shape name for the constructor docstring.
+    :param typo: 'rolled' or 'welded'.
+    :param family: family of shapes for the bi-axial bending constants
+                   ('IH', 'CH', 'RS' or 'other'); if None it's deduced
+                   from the shape name.
+    '''
     def __init__(self, steel, name):
-        ''' Constructor.
+        EC3Shape.__init__(self, name= name, typo= typo)
+        baseClass.__init__(self, steel= steel, name= name)
+    className= baseClass.__name__
+    __init__.__qualname__= className+'.__init__'
+    __init__.__doc__= ''' Constructor.
 
         :param steel: steel material.
-        :param name: shape name (i.e. IPE_600)
-        '''
-        super(IPEShape, self).__init__(name= name, typo= 'rolled')
-        arcelor_metric_shapes.IPEShape.__init__(self,steel,name)
-        
+        :param name: shape name (i.e. %s)
+        ''' % nameExample
+    return type(className, (EC3Shape, baseClass), {'__init__': __init__, '__doc__': doc, '__module__': __name__, '_family': family})
 
-class SHSShape(EC3Shape,arcelor_metric_shapes.SHSShape):
-    """SHS shape with Eurocode 3 verification routines."""
-    def __init__(self,steel,name):
-        ''' Constructor.
-
-        :param steel: steel material.
-        :param name: shape name (i.e. 'SHS175x175x8')
-        '''
-        super(SHSShape, self).__init__(name= name, typo= 'rolled')
-        arcelor_metric_shapes.SHSShape.__init__(self,steel,name)
+IPNShape= _make_ec3_shape(arcelor_metric_shapes.IPNShape, doc= 'IPN shape with Eurocode 3 verification routines.', nameExample= 'IPN_160', family= 'IH')
+IPEShape= _make_ec3_shape(arcelor_metric_shapes.IPEShape, doc= 'IPE shape with Eurocode 3 verification routines.', nameExample= 'IPE_600', family= 'IH')
+SHSShape= _make_ec3_shape(arcelor_metric_shapes.SHSShape, doc= 'SHS shape with Eurocode 3 verification routines.', nameExample= "'SHS175x175x8'", family= 'RS')
 
 '''
 European H beams
@@ -553,135 +719,16 @@ So:
 
 '''
 
-class HEShape(EC3Shape,arcelor_metric_shapes.HEShape):
-    """HE shape with Eurocode 3 verification routines."""
-    def __init__(self,steel,name):
-        ''' Constructor.
+HEShape= _make_ec3_shape(arcelor_metric_shapes.HEShape, doc= 'HE shape with Eurocode 3 verification routines.', nameExample= 'HE_600_A', family= 'IH')
+UPNShape= _make_ec3_shape(arcelor_metric_shapes.UPNShape, doc= 'UPN shape with Eurocode 3 verification routines.', nameExample= 'UPN_320')
+AUShape= _make_ec3_shape(arcelor_metric_shapes.AUShape, doc= 'AU shape with Eurocode 3 verification routines.', nameExample= 'AU_23')
+CHSShape= _make_ec3_shape(arcelor_metric_shapes.CHSShape, doc= 'CHS shape with Eurocode 3 verification routines.', nameExample= 'AU_23', family= 'CH')
+RHSShape= _make_ec3_shape(arcelor_metric_shapes.RHSShape, doc= 'RHS shape with Eurocode 3 verification routines.', nameExample= 'AU_23', family= 'RS')
+UCShape= _make_ec3_shape(arcelor_metric_shapes.UCShape, doc= 'UC shape with Eurocode 3 verification routines.', nameExample= 'UC_23', family= 'IH')
+UBShape= _make_ec3_shape(arcelor_metric_shapes.UBShape, doc= 'UB shape with Eurocode 3 verification routines.', nameExample= 'UB356x127x33', family= 'IH')
 
-        :param steel: steel material.
-        :param name: shape name (i.e. HE_600_A)
-        '''
-        super(HEShape, self).__init__(name= name, typo= 'rolled')
-        arcelor_metric_shapes.HEShape.__init__(self,steel,name)
-
-class UPNShape(EC3Shape,arcelor_metric_shapes.UPNShape):
-    """UPN shape with Eurocode 3 verification routines."""
-    def __init__(self,steel,name):
-        ''' Constructor.
+HFSHSShape= _make_ec3_shape(bs_en_10210_shapes.HFSHSShape, doc= 'BS EN 10210-2: 2006 steel shapes with Eurocode 3 verification routines.', nameExample= "'HFSHS300x300x10.0'", family= 'RS')
 
-        :param steel: steel material.
-        :param name: shape name (i.e. UPN_320)
-        '''
-        super(UPNShape, self).__init__(name= name, typo= 'rolled')
-        arcelor_metric_shapes.UPNShape.__init__(self,steel,name)
-
-class AUShape(EC3Shape,arcelor_metric_shapes.AUShape):
-    """AU shape with Eurocode 3 verification routines."""
-    def __init__(self,steel,name):
-        ''' Constructor.
-
-        :param steel: steel material.
-        :param name: shape name (i.e. AU_23)
-        '''
-        super(AUShape, self).__init__(name= name, typo= 'rolled')
-        arcelor_metric_shapes.AUShape.__init__(self,steel,name)
-
-class CHSShape(EC3Shape,arcelor_metric_shapes.CHSShape):
-    """CHS shape with Eurocode 3 verification routines."""
-    def __init__(self,steel,name):
-        ''' Constructor.
-
-        :param steel: steel material.
-        :param name: shape name (i.e. AU_23)
-        '''
-        super(CHSShape, self).__init__(name= name, typo='rolled')
-        arcelor_metric_shapes.CHSShape.__init__(self,steel,name)
-    
-class RHSShape(EC3Shape,arcelor_metric_shapes.RHSShape):
-    """RHS shape with Eurocode 3 verification routines."""
-    def __init__(self,steel,name):
-        ''' Constructor.
-
-        :param steel: steel material.
-        :param name: shape name (i.e. AU_23)
-        '''
-        super(RHSShape, self).__init__(name= name, typo= 'rolled')
-        arcelor_metric_shapes.RHSShape.__init__(self,steel,name)
-    
-class UCShape(EC3Shape,arcelor_metric_shapes.UCShape):
-    """UC shape with Eurocode 3 verification routines."""
-    def __init__(self,steel,name):
-        ''' Constructor.
-
-        :param steel: steel material.
-        :param name: shape name (i.e. UC_23)
-        '''
-        super(UCShape, self).__init__(name= name, typo= 'rolled')
-        arcelor_metric_shapes.UCShape.__init__(self,steel,name)
-        
-class UBShape(EC3Shape,arcelor_metric_shapes.UBShape):
-    """UB shape with Eurocode 3 verification routines."""
-    def __init__(self,steel,name):
-        ''' Constructor.
-
-        :param steel: steel material.
-        :param name: shape name (i.e. UB356x127x33)
-        '''
-        super(UBShape, self).__init__(name= name, typo= 'rolled')
-        arcelor_metric_shapes.UBShape.__init__(self,steel,name)
-
-from materials.sections.structural_shapes import bs_en_10210_shapes
-
-class HFSHSShape(EC3Shape, bs_en_10210_shapes.HFSHSShape):
-    """BS EN 10210-2: 2006 steel shapes with Eurocode 3 
-       verification routines.
-    """
-    def __init__(self,steel,name):
-        ''' Constructor.
-
-        :param steel: steel material.
-        :param name: shape name (i.e. 'HFSHS300x300x10.0')
-        '''
-        super(HFSHSShape, self).__init__(name= name, typo= 'rolled')
-        bs_en_10210_shapes.HFSHSShape.__init__(self,steel,name)
-        
-from materials.sections.structural_shapes import bs_en_10219_shapes
-
-class CFSHSShape(EC3Shape, bs_en_10219_shapes.CFSHSShape):
-    """BS EN 10219-2: cold formed square hollow steel shapes 
-       with Eurocode 3 verification routines.
-    """
-    def __init__(self, steel, name):
-        ''' Constructor.
-
-        :param steel: steel material.
-        :param name: shape name (i.e. 'HFSHS300x300x10.0')
-        '''
-        super(CFSHSShape, self).__init__(name= name, typo= 'welded')
-        bs_en_10219_shapes.CFSHSShape.__init__(self, steel, name)
-        
-class CFRHSShape(EC3Shape, bs_en_10219_shapes.CFRHSShape):
-    """BS EN 10219-2: cold formed rectangular hollow steel shapes 
-       with Eurocode 3 verification routines.
-    """
-    def __init__(self, steel, name):
-        ''' Constructor.
-
-        :param steel: steel material.
-        :param name: shape name (i.e. 'HFSHS300x300x10.0')
-        '''
-        super(CFRHSShape, self).__init__(name= name, typo= 'welded')
-        bs_en_10219_shapes.CFRHSShape.__init__(self, steel= steel, name= name)
-        
-class CFCHSShape(EC3Shape, bs_en_10219_shapes.CFCHSShape):
-    """BS EN 10219-2: cold formed circular hollow steel shapes 
-       with Eurocode 3 verification routines.
-    """
-    def __init__(self, steel, name):
-        ''' Constructor.
-
-        :param steel: steel material.
-        :param name: shape name (i.e. 'HFSHS300x300x10.0')
-        '''
-        super(CFCHSShape, self).__init__(name= name, typo= 'welded')
-        bs_en_10219_shapes.CFCHSShape.__init__(self, steel= steel, name= name)
+CFSHSShape= _make_ec3_shape(bs_en_10219_shapes.CFSHSShape, doc= 'BS EN 10219-2: cold formed square hollow steel shapes with Eurocode 3 verification routines.', nameExample= "'HFSHS300x300x10.0'", typo= 'welded', family= 'RS')
+CFRHSShape= _make_ec3_shape(bs_en_10219_shapes.CFRHSShape, doc= 'BS EN 10219-2: cold formed rectangular hollow steel shapes with Eurocode 3 verification routines.', nameExample= "'HFSHS300x300x10.0'", typo= 'welded', family= 'RS')
+CFCHSShape= _make_ec3_shape(bs_en_10219_shapes.CFCHSShape, doc= 'BS EN 10219-2: cold formed circular hollow steel shapes with Eurocode 3 verification routines.', nameExample= "'HFSHS300x300x10.0'", typo= 'welded', family= 'CH')
@@ -5,14 +5,82 @@ __license__= "GPL"
 __version__= "3.0"
 __email__= "l.pereztato@ciccp.es, ana.ortega@ciccp.es "
 
+import os
+import io
 import sys
+import hashlib
+import collections
 import xc
 # Macros
 from misc_utils import log_messages as lmsg
 
-# TO ENHANCE: Interactions diagrams ("d" and "k") are calculated each time we 
-# call the checking routines. Maybe it's a good idea to calculate them once and
-# write them in a file to use them as needed.
+# Interactions diagrams ("d" and "k") are calculated each time we call the
+# checking routines. If a cache directory is given to the container, the
+# three-dimensional diagrams are written in it and read from there the next
+# time they are needed (see calcInteractionDiagrams).
+
+def _get_parameter_values(material, names):
+    ''' Return a string with the values of the material parameters whose
+        names are given as argument (the methods are called to get them).
+
+    :param material: concrete or steel material.
+    :param names: names of the parameters.
+    '''
+    values= list()
+    for name in names:
+        value= getattr(material, name, None)
+        if(callable(value)):
+            value= value()
+        values.append(name+'= '+repr(value))
+    return ', '.join(values)
+
+def _get_attribute_values(obj, ignoredAttributes, values, parents= None):
+    ''' Append to the values list the numbers and strings that define
+        the object argument (geometry, reinforcement,...), searching them
+        recursively in its attributes. The XC objects (fiber models, 
+        materials,...) are not Python values so they are represented by 
+        their type only.
+
+    :param obj: object to get the values from.
+    :param ignoredAttributes: names of the attributes to leave out.
+    :param values: list to append the values to.
+    :param parents: identifiers of the objects that contain this one
+                    (to avoid infinite recursion).
+    '''
+    if(parents is None):
+        parents= set()
+    if((obj is None) or isinstance(obj, (bool, int, float, str))):
+        values.append(repr(obj))
+    elif(id(obj) in parents):
+        values.append('<parent>')
+    elif(type(obj).__module__.split('.')[0] in ('xc', 'geom', 'xc_base')):
+        values.append(type(obj).__name__)
+    else:
+        parents.add(id(obj))
+        if(isinstance(obj, (list, tuple))):
+            values.append('[')
+            for item in obj:
+                _get_attribute_values(item, ignoredAttributes, values, parents)
+            values.append(']')
+        elif(isinstance(obj, dict)):
+            values.append('{')
+            for key in sorted(obj, key= str):
+                values.append(str(key)+':')
+                _get_attribute_values(obj[key], ignoredAttributes, values, parents)
+            values.append('}')
+        else:
+            attributes= dict(getattr(obj, '__dict__', {}))
+            for cls in type(obj).__mro__:
+                for name in getattr(cls, '__slots__', ()):
+                    if(hasattr(obj, name)):
+                        attributes[name]= getattr(obj, name)
+            values.append(type(obj).__name__+'(')
+            for name in sorted(attributes):
+                if(name not in ignoredAttributes):
+                    values.append(name+'=')
+                    _get_attribute_values(attributes[name], ignoredAttributes, values, parents)
+            values.append(')')
+        parents.remove(id(obj))
 
 class SectionContainer(object):
     ''' Section container.
@@ -20,20 +88,68 @@ class SectionContainer(object):
     :ivar sections: List with the section definitions.
     :ivar mapSections: Dictionary with pairs (sectionName, reference to
                        section definition.
-    :ivar mapInteractionDiagrams:  file containing a dictionary such that
-                                   associates each element with the two 
-                                   interactions diagrams of materials 
-                                   to be used in the verification.
+    :ivar mapOuterSections: Dictionary with pairs (name, reference to the
+                            objects in the sections list).
+    :ivar mapInteractionDiagrams:  ordered dictionary that associates each
+                                   (section name, material diagram type,
+                                   interaction diagram type) tuple with 
+                                   its interaction diagram (the least 
+                                   recently used come first).
+    :ivar maxInteractionDiagrams: maximum number of interaction diagrams
+                                  kept in mapInteractionDiagrams.
+    :ivar interactionDiagramsCacheDir: directory where the 3D interaction
+                                       diagrams are stored to reuse them in
+                                       subsequent runs (if None they are
+                                       computed each time).
     '''
-    def __init__(self):
+    __slots__= ('sections', 'mapSections', 'mapOuterSections', 'mapInteractionDiagrams', 'maxInteractionDiagrams', 'interactionDiagramsCacheDir')
+    reportBufferSize= 64 # number of section reports written at once.
+    # Material parameters that shape the interaction diagrams (the methods
+    # are called to get their values).
+    concreteDiagramParameters= ('fck', 'gmmC', 'alfacc', 'initTensStiff', 'fmaxK', 'fmaxD', 'epsilon0', 'epsilonU')
+    steelDiagramParameters= ('fyk', 'gammaS', 'Es', 'emax', 'k')
+    # Section attributes left out of the interaction diagram cache keys:
+    # the automatically generated names change from one run to the next,
+    # the objects created when the fiber model is defined are not part of
+    # the section definition and the materials enter the keys through the
+    # parameters above.
+    cacheKeyIgnoredAttributes= frozenset(['familyName', 'fiberSectionRepr', 'reinfLayers', 'reinfLayer', 'idParams', 'diagType', 'concrDiagName', 'reinfDiagName', 'concrType', 'reinfSteelType'])
+    def __init__(self, interactionDiagramsCacheDir= None, maxInteractionDiagrams= 1024):
         ''' Container for the reinforced concrete definitions (name, concrete
         type, rebar positions,...).
 
+        :param interactionDiagramsCacheDir: directory where the 3D 
+                                            interaction diagrams are stored
+                                            to reuse them in subsequent runs
+                                            (defaults to None: no cache).
+        :param maxInteractionDiagrams: maximum number of interaction diagrams
+                                       kept in memory (the least recently 
+                                       used are discarded first).
         '''
         self.sections= [] # List with the section definitions.
         self.mapSections= {} # Dictionary with pairs (sectionName, reference to
                              # section definition.
+        self.mapOuterSections= {} # Dictionary with pairs (name, reference to
+                                  # the objects in the sections list).
         self.mapInteractionDiagrams= None
+        self.maxInteractionDiagrams= maxInteractionDiagrams
+        self.interactionDiagramsCacheDir= interactionDiagramsCacheDir
+
+    def __getstate__(self):
+        ''' Return the state of the object to pickle it.'''
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state):
+        ''' Restore the state of the object from a pickle (the containers
+            pickled by previous versions lack some of the attributes).
+
+        :param state: dictionary with the values of the attributes.
+        '''
+        self.__init__()
+        for name, value in state.items():
+            setattr(self, name, value)
+        if(not self.mapOuterSections):
+            self.mapOuterSections= {s.name: s for s in self.sections}
 
     def append(self, rcSections):
         ''' Append the argument to the container.
@@ -42,9 +158,21 @@ class SectionContainer(object):
         '''
         rcSections.createSections()
         self.sections.append(rcSections)
+        self.mapOuterSections[rcSections.name]= rcSections
+        # Update references to individual sections.
+        self.mapSections.update({ss.name: ss for ss in rcSections.lstRCSects})
+
+    def appendSections(self, rcSectionsList):
+        ''' Append all the objects of the list argument to the container.
+
+        :param rcSectionsList: list of objects to append.
+        '''
+        for rcSections in rcSectionsList:
+            rcSections.createSections()
+        self.sections.extend(rcSectionsList)
+        self.mapOuterSections.update({rcSections.name: rcSections for rcSections in rcSectionsList})
         # Update references to individual sections.
-        for ss in rcSections.lstRCSects:
-            self.mapSections[ss.name]= ss
+        self.mapSections.update({ss.name: ss for rcSections in rcSectionsList for ss in rcSections.lstRCSects})
 
     def extend(self, other):
         ''' Add all the elements of the container argument to the calling one.
@@ -53,14 +181,11 @@ class SectionContainer(object):
         '''
         self.sections.extend(other.sections)
         self.mapSections.update(other.mapSections)
+        self.mapOuterSections.update(other.mapOuterSections)
 
     def search(self,nmb):
         ''' Return section named nmb (if founded) '''
-        retval= None
-        for s in self.sections:
-          if(s.name==nmb):
-            retval= s
-        return retval
+        return self.mapOuterSections.get(nmb)
 
     def createRCsections(self,preprocessor,matDiagType):
         '''Creates for each element in the container the fiber sections 
@@ -74,35 +199,149 @@ class SectionContainer(object):
         :param preprocessor: XC preprocessor for the finite element model.
         :param matDiagType: type of stress-strain diagram (="k" for characteristic diagram, ="d" for design diagram)
         '''
+        # The sections are created one after another: they are all registered
+        # in the same material handler, and the XC routines hold the GIL.
         for s in self.sections:
-            for i in range(len(s.lstRCSects)):
-                s.lstRCSects[i].defRCSection(preprocessor,matDiagType)
+            for rcs in s.lstRCSects:
+                rcs.defRCSection(preprocessor,matDiagType)
+
 
+    def getInteractionDiagramCacheFileName(self, rcs, matDiagType, diagramType= 'NMyMz'):
+        ''' Return the name of the file that stores the interaction diagram
+            of the section argument in the cache directory. The name 
+            contains a hash of the values that define the section 
+            (geometry, reinforcement and number of divisions) and of the 
+            parameters of its materials (strengths, partial safety
+            factors,...) so a modified section doesn't reuse an outdated
+            diagram.
+
+        :param rcs: reinforced concrete section.
+        :param matDiagType: 'k' for characteristic, 'd' for design.
+        :param diagramType: interaction diagram type.
+        '''
+        sectionValues= list()
+        _get_attribute_values(rcs, self.cacheKeyIgnoredAttributes, sectionValues)
+        description= ' '.join(sectionValues)
+        concreteParameters= _get_parameter_values(rcs.fiberSectionParameters.concrType, self.concreteDiagramParameters)
+        steelParameters= _get_parameter_values(rcs.fiberSectionParameters.reinfSteelType, self.steelDiagramParameters)
+        key= '|'.join([rcs.name, matDiagType, diagramType, description, concreteParameters, steelParameters])
+        digest= hashlib.blake2b(key.encode('utf-8'), digest_size= 16).hexdigest()
+        return os.path.join(self.interactionDiagramsCacheDir, rcs.name+'_'+diagramType+'_'+digest+'.dat')
+
+    def calcInteractionDiagram(self, preprocessor, rcs, matDiagType):
+        ''' Return the 3D interaction diagram of the section argument, 
+            reading it from the cache directory if it has been computed 
+            before.
+
+        :param preprocessor: XC preprocessor for the finite element model.
+        :param rcs: reinforced concrete section.
+        :param matDiagType: 'k' for characteristic, 'd' for design.
+        '''
+        if(self.interactionDiagramsCacheDir is None):
+            return rcs.defInteractionDiagram(preprocessor)
+        fileName= self.getInteractionDiagramCacheFileName(rcs, matDiagType)
+        if(os.path.exists(fileName)):
+            # Same name and parameters as the diagrams computed by
+            # defInteractionDiagram.
+            rcs.defInteractionDiagramParameters(preprocessor)
+            retval= preprocessor.getMaterialHandler.newInteractionDiagram('diagInt'+rcs.name)
+            retval.readFrom(fileName)
+        else:
+            retval= rcs.defInteractionDiagram(preprocessor)
+            os.makedirs(self.interactionDiagramsCacheDir, exist_ok= True)
+            retval.writeTo(fileName)
+        return retval
+
+    def getInteractionDiagramBuilder(self, preprocessor, matDiagType, diagramType= 'NMyMz'):
+        ''' Return the function that computes the interaction diagram of
+            a section (None if the diagram type is unknown).
+
+        :param preprocessor:   XC preprocessor for the finite element model.
+        :param matDiagType:    'k' for characteristic, 'd' for design
+        :param diagramType:    three dimensional diagram: NMyMz
+                               bi-dimensional diagram: NMy
+                               bi-dimensional diagram: NMz
+        '''
+        builders= {'NMyMz': lambda rcs: self.calcInteractionDiagram(preprocessor, rcs, matDiagType),
+                   'NMy': lambda rcs: rcs.defInteractionDiagramNMy(preprocessor),
+                   'NMz': lambda rcs: rcs.defInteractionDiagramNMz(preprocessor)}
+        return builders.get(diagramType)
+
+    def clearInteractionDiagrams(self):
+        ''' Forget the interaction diagrams computed before (i.e. when
+            they belong to a finite element problem that no longer exists).
+        '''
+        self.mapInteractionDiagrams= collections.OrderedDict()
+
+    def getInteractionDiagram(self, name, preprocessor, matDiagType, diagramType= 'NMyMz'):
+        ''' Return the interaction diagram of the section with the name
+            argument. The diagram is computed only the first time it's 
+            requested (or if it has not been computed by 
+            calcInteractionDiagrams), so the sections that are never 
+            checked don't pay the cost of their computation. Only the
+            maxInteractionDiagrams most recently used diagrams are kept;
+            the diagrams discarded are computed again when requested.
+
+        :param name: name of the section.
+        :param preprocessor:   XC preprocessor for the finite element model.
+        :param matDiagType:    'k' for characteristic, 'd' for design
+        :param diagramType:    three dimensional diagram: NMyMz
+                               bi-dimensional diagram: NMy
+                               bi-dimensional diagram: NMz
+        '''
+        if(not isinstance(self.mapInteractionDiagrams, collections.OrderedDict)):
+            self.clearInteractionDiagrams()
+        key= (name, matDiagType, diagramType)
+        retval= self.mapInteractionDiagrams.get(key)
+        if(retval is None):
+            rcs= self.mapSections.get(name)
+            if(rcs is None):
+                lmsg.error("getInteractionDiagram; section: '" + str(name) + "' not found.")
+                return None
+            builder= self.getInteractionDiagramBuilder(preprocessor, matDiagType, diagramType)
+            if(builder is None):
+                lmsg.error("getInteractionDiagram; interaction diagram type: '" + diagramType + "' unknown.")
+                return None
+            retval= builder(rcs)
+            self.mapInteractionDiagrams[key]= retval
+            while(len(self.mapInteractionDiagrams)>self.maxInteractionDiagrams):
+                self.mapInteractionDiagrams.popitem(last= False) # least recently used.
+        else:
+            self.mapInteractionDiagrams.move_to_end(key)
+        return retval
 
     def calcInteractionDiagrams(self,preprocessor,matDiagType, diagramType= 'NMyMz'):
-        '''Calculates 3D interaction diagrams for each section.
+        '''Calculates 3D interaction diagrams for each section (warms up
+           the diagrams returned by getInteractionDiagram).
 
         :param preprocessor:   XC preprocessor for the finite element model.
         :param matDiagType:    'k' for characteristic, 'd' for design
         :param diagramType:    three dimensional diagram: NMyMz
                                bi-dimensional diagram: NMy
                                bi-dimensional diagram: NMz
+                               (only the three dimensional ones are
+                               stored in the cache directory).
         '''
-        self.mapInteractionDiagrams= {}
+        self.clearInteractionDiagrams()
+        if(len(self.mapSections)>self.maxInteractionDiagrams):
+            lmsg.warning('calcInteractionDiagrams; the number of sections: '+str(len(self.mapSections))+' is greater than the number of interaction diagrams kept in memory: '+str(self.maxInteractionDiagrams)+'; some of them will be computed again.')
         for s in self.sections:
             for rcs in s.lstRCSects:
-                diag= None
-                if(diagramType=='NMyMz'):
-                    diag= rcs.defInteractionDiagram(preprocessor)
-                elif(diagramType=='NMy'):
-                    diag= rcs.defInteractionDiagramNMy(preprocessor,matDiagType)
-                elif(diagramType=='NMz'):
-                    diag= rcs.defInteractionDiagramNMz(preprocessor,matDiagType)
-                else:
-                    lmsg.error("calcInteractionDiagrams; interaction diagram type: " + diagramType + "' unknown.")
-                self.mapInteractionDiagrams[rcs.name]= diag
+                if(self.getInteractionDiagram(rcs.name, preprocessor, matDiagType, diagramType) is None):
+                    return # Error already reported.
 
     def report(self, os= sys.stdout, indentation= ''):
-        ''' Get a report of the object contents.'''
-        for s in self.sections:
-            s.report(os= os, indentation= indentation)
+        ''' Get a report of the object contents.
+
+        :param os: output stream.
+        :param indentation: indentation to apply to the report lines.
+        '''
+        # The sections write their reports in a buffer that is sent to
+        # the output stream every reportBufferSize sections.
+        buf= io.StringIO()
+        for i, s in enumerate(self.sections, 1):
+            s.report(os= buf, indentation= indentation)
+            if(i % self.reportBufferSize == 0):
+                os.write(buf.getvalue())
+                buf= io.StringIO()
+        os.write(buf.getvalue())
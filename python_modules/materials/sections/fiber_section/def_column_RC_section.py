@@ -223,10 +223,12 @@ class RCCircularSection(def_simple_RC_section.RCSectionBase, section_properties.
         
     def report(self, os= sys.stdout, indentation= ''):
         ''' Get a report of the object contents.'''
-        super(RCCircularSection, self).repeort(os= os, indentation= indentation)
+        super(RCCircularSection, self).report(os= os, indentation= indentation)
         indentation+= '  '
+        os.write(indentation+'external radius: '+str(self.Rext)+'\n')
+        os.write(indentation+'internal radius: '+str(self.Rint)+'\n')
         os.write(indentation+'main reinforcement: \n')
-        mainReinf.report(os= os, indentation= indentation)
+        self.mainReinf.report(os= os, indentation= indentation)
         os.write(indentation+'shear reinforcement: \n')        
-        shReinf.report(os= os, indentation= indentation)
+        self.shReinf.report(os= os, indentation= indentation)
     
@@ -12,16 +12,47 @@ __email__= "l.pereztato@ciccp.es" "ana.Ortega@ciccp.es"
 import sys
 import math
 import uuid
+import itertools
 import geom
 import xc
 from materials.sections import section_properties
 from materials.sections import stress_calc as sc
 from misc_utils import log_messages as lmsg
 import matplotlib.pyplot as plt
+from matplotlib.collections import PatchCollection
+
+_PI_64= math.pi/64.0 # moment of inertia of a bar: _PI_64*diameter**4
 
 # Classes defining reinforcement.
 
-class ShearReinforcement(object):
+class _SlotsPickling(object):
+    ''' Pickle support for the classes that declare __slots__ (objects
+        pickled before the slots were declared are also restored).'''
+    __slots__= ()
+    
+    def __getstate__(self):
+        ''' Return the state of the object to pickle it (the values of the
+            slots declared in all the classes of the hierarchy and the
+            attributes in __dict__ if any).'''
+        retval= dict(getattr(self, '__dict__', {}))
+        for cls in type(self).__mro__:
+            slots= getattr(cls, '__slots__', ())
+            if(isinstance(slots, str)):
+                slots= (slots,)
+            for name in slots:
+                if((name not in ('__dict__', '__weakref__')) and hasattr(self, name)):
+                    retval[name]= getattr(self, name)
+        return retval
+
+    def __setstate__(self, state):
+        ''' Restore the state of the object from a pickle.
+
+        :param state: dictionary with the values of the attributes.
+        '''
+        for name, value in state.items():
+            setattr(self, name, value)
+
+class ShearReinforcement(_SlotsPickling):
     ''' Definition of the variables that make up a family of shear 
     reinforcing bars.
 
@@ -36,6 +67,12 @@ class ShearReinforcement(object):
     :ivar angThetaConcrStruts: angle between the concrete's compression struts 
                              and the axis of the member expressed in radians.
     '''
+    __slots__= ('familyName', 'nShReinfBranches', 'areaShReinfBranch', 'shReinfSpacing', 'angAlphaShReinf', 'angThetaConcrStruts')
+    # Default family names: a per-process prefix followed by a counter
+    # (cheaper than calling uuid for each new family).
+    _autoIdPrefix= uuid.uuid4().hex[:12]
+    _autoId= itertools.count()
+    
     def __init__(self,familyName= None,nShReinfBranches= 0.0,areaShReinfBranch= 0.0,shReinfSpacing= 0.2,angAlphaShReinf= math.pi/2.0,angThetaConcrStruts= math.pi/4.0):
         '''
         :param familyName: name identifying the family of shear reinforcing bars.
@@ -55,7 +92,7 @@ class ShearReinforcement(object):
  
         # If no name provided, generate it.
         if(not familyName):
-            familyName= str(uuid.uuid1())
+            familyName= f"shReinf_{ShearReinforcement._autoIdPrefix}_{next(ShearReinforcement._autoId)}"
         self.familyName= familyName # name identifying the family of shear reinforcing bars
         self.nShReinfBranches= nShReinfBranches # Number of effective branches
         self.areaShReinfBranch= areaShReinfBranch # Area of the shear reinforcing bar
@@ -63,23 +100,13 @@ class ShearReinforcement(object):
         self.angAlphaShReinf= angAlphaShReinf # angle between the shear reinforcing bars and the axis of the member.
         self.angThetaConcrStruts= angThetaConcrStruts # angle between the concrete's compression struts and the axis of the member
         
+    def _key(self):
+        ''' Return the tuple of values that identify the object.'''
+        return (self.familyName, self.nShReinfBranches, self.areaShReinfBranch, self.shReinfSpacing, self.angAlphaShReinf, self.angThetaConcrStruts)
+        
     def __eq__(self, other):
         '''Overrides the default implementation'''
-        if(self is not other):
-            retval= (self.familyName == other.familyName)
-            if(retval):
-                retval= (self.nShReinfBranches == other.nShReinfBranches)
-            if(retval):
-                retval= (self.areaShReinfBranch == other.areaShReinfBranch)
-            if(retval):
-                retval= (self.shReinfSpacing == other.shReinfSpacing)
-            if(retval):
-                retval= (self.angAlphaShReinf == other.angAlphaShReinf)
-            if(retval):
-                retval= (self.angThetaConcrStruts == other.angThetaConcrStruts)
-        else:
-            retval= True
-        return retval
+        return (self is other) or (isinstance(other, ShearReinforcement) and (self._key() == other._key()))
     
     def getAs(self):
         '''returns the area per unit length of the family of shear 
@@ -91,16 +118,16 @@ class ShearReinforcement(object):
         ''' Get a report of the object contents.'''
         steelArea= self.getAs()
         if(steelArea>0.0):
-            os.write(indentation+'family name: '+str(self.familyName)+'\n')
-            os.write(indentation+'number of effective branches: '+str(self.nShReinfBranches)+'\n')
-            os.write(indentation+'area of the shear reinforcing bar: '+str(self.areaShReinfBranch)+'\n')
-            os.write(indentation+'longitudinal distance between transverse reinforcements: '+str(self.shReinfSpacing)+'\n')
-            os.write(indentation+'angle between the shear reinforcing bars and the axis of the member: '+str(math.degrees(self.angAlphaShReinf))+'\n')
-            os.write(indentation+'angle between the concrete\'s compression struts and the axis of the member: '+str(math.degrees(self.angThetaConcrStruts))+'\n')
+            os.write(f"{indentation}family name: {self.familyName}\n"
+                     f"{indentation}number of effective branches: {self.nShReinfBranches}\n"
+                     f"{indentation}area of the shear reinforcing bar: {self.areaShReinfBranch}\n"
+                     f"{indentation}longitudinal distance between transverse reinforcements: {self.shReinfSpacing}\n"
+                     f"{indentation}angle between the shear reinforcing bars and the axis of the member: {math.degrees(self.angAlphaShReinf)}\n"
+                     f"{indentation}angle between the concrete's compression struts and the axis of the member: {math.degrees(self.angThetaConcrStruts)}\n")
         else:
             os.write(indentation+'family name: -\n')
 
-class ReinfRow(object):
+class ReinfRow(_SlotsPickling):
     ''' Definition of the variables that make up a family (row) of main 
     (longitudinal) reinforcing bars.
 
@@ -111,6 +138,8 @@ class ReinfRow(object):
     :ivar width: width of the cross-section (defautls to 1m)
     :ivar cover: concrete cover.
     '''
+    __slots__= ('rebarsDiam', 'areaRebar', 'rebarsSpacing', 'nRebars', 'width', 'cover', 'coverLat', 'reinfLayer')
+    
     def __init__(self, rebarsDiam=None, areaRebar= None, rebarsSpacing= None, nRebars= None, width= 1.0, nominalCover= 0.03, nominalLatCover= 0.03):
         ''' Constructor.
 
@@ -124,17 +153,15 @@ class ReinfRow(object):
         '''
         if rebarsDiam:
             self.rebarsDiam= rebarsDiam
+            if areaRebar:
+                self.areaRebar= areaRebar
+            else:
+                self.areaRebar=math.pi*rebarsDiam**2/4.
         elif areaRebar:
             self.areaRebar= areaRebar
             self.rebarsDiam=2*math.sqrt(areaRebar/math.pi)
         else:
             lmsg.warning('You must define either the diameter or the area of rebars')
-        if areaRebar:
-            self.areaRebar= areaRebar
-        elif rebarsDiam:
-            self.areaRebar=math.pi*rebarsDiam**2/4.
-        else:
-            lmsg.warning('You must define either the diameter or the area of rebars')
         self.width= width
         if nRebars:
             self.nRebars= nRebars
@@ -143,30 +170,19 @@ class ReinfRow(object):
             self.rebarsSpacing= (width-2*nominalLatCover-self.rebarsDiam)/(nRebars-1)
         elif rebarsSpacing:
             self.rebarsSpacing= rebarsSpacing
-            nRebarsTeor= width/rebarsSpacing
-            self.nRebars= int(math.floor(nRebarsTeor))
+            self.nRebars= int(width/rebarsSpacing) # truncation (width/rebarsSpacing>=0).
         else:
             lmsg.warning('You must define either the number of rebars or the rebar spacing')
         self.cover= nominalCover+self.rebarsDiam/2.0
         self.centerRebars(width)
         
+    def _key(self):
+        ''' Return the tuple of values that identify the object.'''
+        return (self.rebarsDiam, self.areaRebar, self.rebarsSpacing, self.nRebars, self.width, self.cover)
+        
     def __eq__(self, other):
         '''Overrides the default implementation'''
-        if(self is not other):
-            retval= (self.rebarsDiam == other.rebarsDiam)
-            if(retval):
-                retval= (self.areaRebar == other.areaRebar)
-            if(retval):
-                retval= (self.rebarsSpacing == other.rebarsSpacing)
-            if(retval):
-                retval= (self.nRebars == other.nRebars)
-            if(retval):
-                retval= (self.width == other.width)
-            if(retval):
-                retval= (self.cover == other.cover)
-        else:
-            retval= True
-        return retval
+        return (self is other) or (isinstance(other, ReinfRow) and (self._key() == other._key()))
     
     def getAs(self):
         ''' Returns the total cross-sectional area of reinforcing steel 
@@ -177,7 +193,7 @@ class ReinfRow(object):
     def getI(self):
         ''' Return the moment of inertia around the axis containing the bar
             centers.'''
-        return self.nRebars*math.pi*(self.rebarsDiam/2.0)**4/4.0
+        return self.nRebars*_PI_64*self.rebarsDiam**4
       
     def centerRebars(self,width):
         '''center the row of rebars in the width of the section'''
@@ -194,14 +210,15 @@ class ReinfRow(object):
         :param p2: last point of the layer.
         '''
         if(self.nRebars>0):
-            self.reinfLayer= reinforcement.newStraightReinfLayer(diagramName)
-            self.reinfLayer.code= layerCode
-            self.reinfLayer.numReinfBars= self.nRebars
-            self.reinfLayer.barDiameter= self.rebarsDiam
-            self.reinfLayer.barArea= self.areaRebar
-            self.reinfLayer.p1= p1
-            self.reinfLayer.p2= p2
-            return self.reinfLayer
+            layer= reinforcement.newStraightReinfLayer(diagramName)
+            layer.code= layerCode
+            layer.numReinfBars= self.nRebars
+            layer.barDiameter= self.rebarsDiam
+            layer.barArea= self.areaRebar
+            layer.p1= p1
+            layer.p2= p2
+            self.reinfLayer= layer
+            return layer
         
     def defCircularLayer(self,reinforcement, code, diagramName, extRad, initAngle= 0.0, finalAngle= 2*math.pi):
         '''Definition of a circular reinforcement layer in the XC section 
@@ -215,37 +232,40 @@ class ReinfRow(object):
         :param finalAngle: final angle.
         '''
         if(self.nRebars>0):
-            self.reinfLayer= reinforcement.newCircReinfLayer(diagramName)
-            self.reinfLayer.code= code
-            self.reinfLayer.numReinfBars= self.nRebars
-            self.reinfLayer.barDiameter= self.rebarsDiam
-            self.reinfLayer.barArea= self.areaRebar
-            self.reinfLayer.initAngle= initAngle
-            self.reinfLayer.finalAngle= finalAngle
-            self.reinfLayer.radius= extRad-self.cover
-            return self.reinfLayer
+            layer= reinforcement.newCircReinfLayer(diagramName)
+            layer.code= code
+            layer.numReinfBars= self.nRebars
+            layer.barDiameter= self.rebarsDiam
+            layer.barArea= self.areaRebar
+            layer.initAngle= initAngle
+            layer.finalAngle= finalAngle
+            layer.radius= extRad-self.cover
+            self.reinfLayer= layer
+            return layer
         
     def report(self, os= sys.stdout, indentation= ''):
         ''' Get a report of the object contents.'''
-        os.write(indentation+'bar diameter: '+str(self.rebarsDiam*1e3)+' mm\n')
-        os.write(indentation+'bar area: '+str(self.areaRebar*1e4)+' cm2\n')
-        os.write(indentation+'spacing: '+str(self.rebarsSpacing*1e3)+' mm\n')
-        os.write(indentation+'number of bars: '+str(self.nRebars)+'\n')
-        os.write(indentation+'width: '+str(self.width*1e3)+' mm\n')
-        os.write(indentation+'cover: '+str(self.cover*1e3)+' mm\n')
+        os.write(f"{indentation}bar diameter: {self.rebarsDiam*1e3} mm\n"
+                 f"{indentation}bar area: {self.areaRebar*1e4} cm2\n"
+                 f"{indentation}spacing: {self.rebarsSpacing*1e3} mm\n"
+                 f"{indentation}number of bars: {self.nRebars}\n"
+                 f"{indentation}width: {self.width*1e3} mm\n"
+                 f"{indentation}cover: {self.cover*1e3} mm\n")
 
 def RebarRow2ReinfRow(rebarRow, width= 1.0, nominalLatCover= 0.03):
-    ''' Returns a RebarRow object from a ReinfRow object
+    ''' Returns a ReinfRow object from a RebarRow object
         as defined in the rebar_family module.
 
     :param rebarRow: RebarRow object.
     :param width: width of the cross-section (defautls to 1 m)
     :param nominalLatCover: nominal lateral cover (only considered if nRebars is defined, defaults to 0.03)
     '''
-    return RebarRow(rebarsDiam= rebarRow.diam,rebarsSpacing= rebarRows.spacing,width= widht, nominalCover= rebarRow.cover, nominalLatCover= nominalLatCover)
+    return ReinfRow(rebarsDiam= rebarRow.diam,rebarsSpacing= rebarRow.spacing,width= width, nominalCover= rebarRow.concreteCover, nominalLatCover= nominalLatCover)
 
-class LongReinfLayers(object):
+class LongReinfLayers(_SlotsPickling):
     ''' Layers of longitudinal reinforcement.'''
+    __slots__= ('rebarRows', 'reinfLayers')
+    
     def __init__(self, lst= None):
         ''' Constructor.'''
         if(lst):
@@ -256,16 +276,7 @@ class LongReinfLayers(object):
                     
     def __eq__(self, other):
         '''Overrides the default implementation'''
-        if(self is not other):
-            retval= (len(self.rebarRows) == len(other.rebarRows))
-            if(retval):
-                for rowA, rowB in zip(self.rebarRows, other.rebarRows):
-                    retval= (rowA==rowB)
-                    if(not retval):
-                        break
-        else:
-            retval= True
-        return retval
+        return (self is other) or (isinstance(other, LongReinfLayers) and (tuple(self.rebarRows) == tuple(other.rebarRows)))
     
     def __getitem__(self, index):
         '''Return the i-th reinforcement row.'''
@@ -282,23 +293,16 @@ class LongReinfLayers(object):
     def getAsRows(self):
         '''Returns a list with the cross-sectional area of the rebars in 
            each row.'''
-        retval=[]
-        for rbRow in self.rebarRows:
-            retval.append(rbRow.getAs())
-        return retval
+        return [rbRow.getAs() for rbRow in self.rebarRows]
        
     def getAs(self):
         '''returns the cross-sectional area of the rebars.'''
-        return sum(self.getAsRows())
+        return sum(rbRow.getAs() for rbRow in self.rebarRows)
 
     def getMinCover(self):
-        '''Return the minimum value of the cover.'''
-        retval= 1e6
-        if(len(self.rebarRows)>0):
-            retval= self.rebarRows[0].cover
-            for rbRow in self.rebarRows[1:]:
-                retval= min(retval,rbRow.cover)
-        return retval
+        '''Return the minimum value of the cover (1e6 if there are no
+           rows).'''
+        return min((rbRow.cover for rbRow in self.rebarRows), default= 1e6)
         
     def getRowsCGcover(self):
         '''returns the distance from the center of gravity of the rebars
@@ -306,46 +310,50 @@ class LongReinfLayers(object):
         '''
         retval=0
         if(len(self.rebarRows)>0):
-            for rbRow in self.rebarRows:
-                retval+= rbRow.getAs()*rbRow.cover
-            retval/= self.getAs()
+            asRows= self.getAsRows() # compute the areas only once.
+            retval= sum(a*rbRow.cover for a, rbRow in zip(asRows, self.rebarRows))
+            retval/= sum(asRows)
         return retval
 
+    def getAggregateProperties(self):
+        ''' Return the total area of the rows, the sum of their moments of
+            inertia around the axes containing their bar centers and the
+            cover of their center of gravity (see getRowsCGcover) computed
+            in a single pass over the rows.
+        '''
+        totalAs= 0.0
+        totalI= 0.0
+        moment= 0.0
+        for rbRow in self.rebarRows:
+            rowAs= rbRow.getAs()
+            totalAs+= rowAs
+            moment+= rowAs*rbRow.cover
+            totalI+= rbRow.getI()
+        cgCover= 0
+        if(len(self.rebarRows)>0):
+            cgCover= moment/totalAs
+        return totalAs, totalI, cgCover
+
     def getSpacings(self):
         '''returns a list with the distance between bars for each row of bars.'''
-        retval=[]
-        for rbRow in self.rebarRows:
-            retval.append(rbRow.rebarsSpacing)
-        return retval
+        return [rbRow.rebarsSpacing for rbRow in self.rebarRows]
     
     def getDiameters(self):
         '''returns a list with the bar diameter for each row of bars in local 
         positive face.'''
-        retval=[]
-        for rbRow in self.rebarRows:
-            retval.append(rbRow.rebarsDiam)
-        return retval
+        return [rbRow.rebarsDiam for rbRow in self.rebarRows]
     
     def getNBar(self):
         '''returns a list with the number of bars for each row.'''
-        retval=[]
-        for rbRow in self.rebarRows:
-            retval.append(rbRow.nRebars)
-        return retval
+        return [rbRow.nRebars for rbRow in self.rebarRows]
 
     def getCover(self):
         '''returns a list with the cover of bars for each row of bars.'''
-        retval=[]
-        for rbRow in self.rebarRows:
-            retval.append(rbRow.cover)
-        return retval
+        return [rbRow.cover for rbRow in self.rebarRows]
     
     def getLatCover(self):
         '''returns a list with the lateral cover of bars for each row of bars.'''
-        retval=[]
-        for rbRow in self.rebarRows:
-            retval.append(rbRow.coverLat)
-        return retval
+        return [rbRow.coverLat for rbRow in self.rebarRows]
 
     def centerRebars(self, b):
         '''centers in the width of the section the rebars.''' 
@@ -361,9 +369,9 @@ class LongReinfLayers(object):
         :param diagramName: name of the strain-stress diagram of the steel.
         :param pointPairs: end points for each row.
         '''
-        for rbRow, pts in zip(self.rebarRows, pointPairs):
-            p1= pts[0]; p2= pts[1]
-            self.reinfLayers.append(rbRow.defStraightLayer(reinforcement,layerCode,diagramName,p1,p2))
+        appendLayer= self.reinfLayers.append
+        for rbRow, (p1, p2) in zip(self.rebarRows, pointPairs):
+            appendLayer(rbRow.defStraightLayer(reinforcement,layerCode,diagramName,p1,p2))
             
     def defCircularLayers(self, reinforcement, code, diagramName, extRad, anglePairs= None):
         '''
@@ -372,18 +380,17 @@ class LongReinfLayers(object):
         :param reinforcement: XC section reinforcement.
         :param code: identifier for the layer.
         :param diagramName: name of the strain-stress diagram of the steel.
-        :param points: end points for each row.
+        :param anglePairs: initial and final angles for each row (if None
+                           the rows are closed circles).
         '''
         if(len(self.rebarRows)>0):
+            appendLayer= self.reinfLayers.append
             if(not anglePairs):
                 for rbRow in self.rebarRows:
-                    layer= rbRow.defCircularLayer(reinforcement,code,diagramName,extRad)
-                    self.reinfLayers.append(layer)
+                    appendLayer(rbRow.defCircularLayer(reinforcement,code,diagramName,extRad))
             else:
-                for rbRow, angles in zip(self.rebarRows, anglePairs):
-                    initAngle= anglePairs[0]; finalAngle= anglePairs[1]
-                    layer= rbRow.defCircularLayer(reinforcement,code,diagramName, extRad, initAngle, finalAngle)
-                    self.reinfLayers.append(layer)
+                for rbRow, (initAngle, finalAngle) in zip(self.rebarRows, anglePairs):
+                    appendLayer(rbRow.defCircularLayer(reinforcement,code,diagramName, extRad, initAngle, finalAngle))
         else:
             lmsg.warning('No longitudinal reinforcement.')
             
@@ -400,7 +407,8 @@ def rebLayer_mm(fi,s,c):
     :param s: spacing [mm]
     :param c: cover [mm] (nominal cover)
     '''
-    return ReinfRow(rebarsDiam=fi*1e-3,areaRebar= math.pi*(fi*1e-3)**2/4.0,rebarsSpacing=s*1e-3,width=1.0,nominalCover=c*1e-3)
+    # ReinfRow computes the area of the bar from its diameter.
+    return ReinfRow(rebarsDiam=fi*1e-3,rebarsSpacing=s*1e-3,width=1.0,nominalCover=c*1e-3)
 
 def rebLayerByNumFi_mm(n,fi,c,latC,L):
     '''Defines a layer of  main reinforcement bars with a fixed number of rebars. Spacing is calculated
@@ -412,7 +420,7 @@ def rebLayerByNumFi_mm(n,fi,c,latC,L):
     :param latC: nominal lateral cover [mm]
     :param L: length where the n rebars and two lateral covers are inserted [mm]
     '''
-    rl=ReinfRow(rebarsDiam=fi*1e-3,areaRebar= math.pi*(fi*1e-3)**2/4.0,nRebars=n,width=L*1e-3,nominalCover=c*1e-3,nominalLatCover=latC*1e-3)
+    rl=ReinfRow(rebarsDiam=fi*1e-3,nRebars=n,width=L*1e-3,nominalCover=c*1e-3,nominalLatCover=latC*1e-3)
     return rl
 
 # Reinforced concrete.
@@ -439,23 +447,13 @@ class RCFiberSectionParameters(object):
         self.nDivIJ= nDivIJ
         self.nDivJK= nDivJK
         
+    def _key(self):
+        ''' Return the tuple of values that identify the object.'''
+        return (self.concrType, self.concrDiagName, self.reinfSteelType, self.reinfDiagName, self.nDivIJ, self.nDivJK)
+        
     def __eq__(self, other):
         '''Overrides the default implementation'''
-        if(self is not other):
-            retval= (self.concrType == other.concrType)
-            if(retval):
-                retval= (self.concrDiagName == other.concrDiagName)
-            if(retval):
-                retval= (self.reinfSteelType == other.reinfSteelType)
-            if(retval):
-                retval= (self.reinfDiagName == other.reinfDiagName)
-            if(retval):
-                retval= (self.nDivIJ == other.nDivIJ)
-            if(retval):
-                retval= (self.nDivJK == other.nDivJK)
-        else:
-            retval= True
-        return retval
+        return (self is other) or (isinstance(other, RCFiberSectionParameters) and (self._key() == other._key()))
 
     def nDivCirc(self):
         '''Alias for nDivIJ when defining circular sections.'''
@@ -528,12 +526,12 @@ class RCFiberSectionParameters(object):
     
     def report(self, os= sys.stdout, indentation= ''):
         ''' Get a report of the object contents.'''
-        os.write(indentation+'concrete type: '+str(self.concrType.materialName)+'\n')
-        os.write(indentation+'concrete stress-strain diagram: '+str(self.concrDiagName)+'\n')
-        os.write(indentation+'steel type: '+str(self.reinfSteelType.materialName)+'\n')
-        os.write(indentation+'steel stress-strain diagram: '+str(self.reinfDiagName)+'\n')
-        os.write(indentation+'number of IJ divisions nDivIJ= '+str(self.nDivIJ)+'\n')
-        os.write(indentation+'number of JK divisions nDivJK= '+str(self.nDivJK)+'\n')
+        os.write(f"{indentation}concrete type: {self.concrType.materialName}\n"
+                 f"{indentation}concrete stress-strain diagram: {self.concrDiagName}\n"
+                 f"{indentation}steel type: {self.reinfSteelType.materialName}\n"
+                 f"{indentation}steel stress-strain diagram: {self.reinfDiagName}\n"
+                 f"{indentation}number of IJ divisions nDivIJ= {self.nDivIJ}\n"
+                 f"{indentation}number of JK divisions nDivJK= {self.nDivJK}\n")
         
 
 class RCSectionBase(object):
@@ -560,17 +558,13 @@ class RCSectionBase(object):
         self.fiberSectionParameters= RCFiberSectionParameters(concrType= concrType, reinfSteelType= reinfSteelType, nDivIJ= nDivIJ, nDivJK= nDivJK)
         self.fiberSectionRepr= None
         
+    def _key(self):
+        ''' Return the tuple of values that identify the object.'''
+        return (self.sectionDescr, self.fiberSectionParameters, self.fiberSectionRepr)
+        
     def __eq__(self, other):
         '''Overrides the default implementation'''
-        if(self is not other):
-            retval= (self.sectionDescr == other.sectionDescr)
-            if(retval):
-                retval= (self.fiberSectionParameters == other.fiberSectionParameters)
-            if(retval):
-                retval= (self.fiberSectionRepr == other.fiberSectionRepr)
-        else:
-            retval= True
-        return retval
+        return (self is other) or (isinstance(other, RCSectionBase) and (self._key() == other._key()))
     
     def getCopy(self):
         ''' Returns a copy of the object.'''
@@ -616,7 +610,7 @@ class RCSectionBase(object):
 
         :param preprocessor: preprocessor of the finite element problem.
         '''
-        return self.fiberSectionParameters.getSteelEquivalenceCoefficien(preprocessor)
+        return self.fiberSectionParameters.getSteelEquivalenceCoefficient(preprocessor)
 
     def defDiagrams(self,preprocessor,matDiagType):
         '''Stress-strain diagrams definition.
@@ -748,10 +742,8 @@ class RCSectionBase(object):
         ax.grid(visible= True, linestyle='dotted')
         # Plot contour.
         contour= self.getContour()
-        x= list(); y= list()
-        for p in contour:
-            x.append(p.x)
-            y.append(p.y)
+        x= [p.x for p in contour]
+        y= [p.y for p in contour]
         ax.fill(x,y,'tab:gray')
         #ax.plot(x,y,'tab:blue')
         # Plot reinforcement.
@@ -760,6 +752,7 @@ class RCSectionBase(object):
         reinforcement= self.geomSection.getReinfLayers
         reinfLayersColors= ['black', 'blue', 'darkblue', 'red', 'darkred', 'darkgreen', 'purple']
         numColors= len(reinfLayersColors)
+        circles= list()
         for idx, reinfLayer in enumerate(reinforcement):
             rebars= reinfLayer.getReinfBars
             rebarColor= reinfLayersColors[idx % numColors]
@@ -767,9 +760,10 @@ class RCSectionBase(object):
                 ptPlot= b.getPos2d # bar position.
                 rPlot= b.diameter/2.0 # bar radius.
                 labelPlot= str(int(round(b.diameter*1e3))) # bar label.
-                circle= plt.Circle((ptPlot.x, ptPlot.y), rPlot, color= rebarColor)
-                ax.add_patch(circle)
+                circles.append(plt.Circle((ptPlot.x, ptPlot.y), rPlot, color= rebarColor))
                 ax.annotate(labelPlot, (ptPlot.x+rPlot, ptPlot.y+rPlot))
+        # Draw all the bars as a single collection.
+        ax.add_collection(PatchCollection(circles, match_original= True))
 
     def plot(self, preprocessor, matDiagType= 'k'):
         ''' Get a drawing of the section using matplotlib.'''
@@ -819,17 +813,9 @@ class BasicRectangularRCSection(RCSectionBase, section_properties.RectangularSec
                 
     def __eq__(self, other):
         '''Overrides the default implementation'''
-        if(self is not other):
-            retval= super(BasicRectangularRCSection, self).__eq__(other)
-            if(retval):
-                retval= section_properties.RectangularSection.__eq__(self, other)
-            if(retval):
-                retval= (self.shReinfZ== other.shReinfZ)
-            if(retval):
-                retval= (self.shReinfY== other.shReinfY)
-        else:
-            retval= True
-        return retval
+        if(self is other):
+            return True
+        return (super(BasicRectangularRCSection, self).__eq__(other) and section_properties.RectangularSection.__eq__(self, other) and ((self.shReinfZ, self.shReinfY) == (other.shReinfZ, other.shReinfY)))
 
     def getCopy(self):
         ''' Returns a deep enough copy of the object.'''
@@ -995,21 +981,10 @@ class RCRectangularSection(BasicRectangularRCSection):
         self.negatvRebarRows= LongReinfLayers() # list of ReinfRow data (negative face)
     def __eq__(self, other):
         '''Overrides the default implementation'''
-        if(self is not other):
-            retval= super(RCRectangularSection, self).__eq__(other)
-            if(retval):
-                retval= (self.minCover == other.minCover)
-            if(retval):
-                retval= (self.shReinfZ == other.shReinfZ)
-            if(retval):
-                retval= (self.shReinfY == other.shReinfY)
-            if(retval):
-                retval= (self.positvRebarRows == other.positvRebarRows)
-            if(retval):
-                retval= (self.negatvRebarRows == other.negatvRebarRows)
-        else:
-            retval= True
-        return retval
+        if(self is other):
+            return True
+        # The shear reinforcement is compared by the base class.
+        return (super(RCRectangularSection, self).__eq__(other) and ((self.minCover, self.positvRebarRows, self.negatvRebarRows) == (other.minCover, other.positvRebarRows, other.negatvRebarRows)))
 
     def flipReinforcement(self):
         ''' Flip the reinforcement top<-->bottom.'''
@@ -1084,16 +1059,41 @@ class RCRectangularSection(BasicRectangularRCSection):
         retval+= n*(self.getAsNeg()+self.getAsPos())
         return retval
     
+    def _getHomogenizedSectionProperties(self):
+        '''Return the area, the distance from the bottom fiber to the centre
+        of gravity and the second moment of area (see getIzHomogenizedSection)
+        of the homogenized section, computed with a single pass over the
+        rows of each face.
+        '''
+        Ac= self.getAc()
+        n= self.getHomogenizationCoefficient()
+        asPos, iPos, cgCoverPos= self.positvRebarRows.getAggregateProperties()
+        asNeg, iNeg, cgCoverNeg= self.negatvRebarRows.getAggregateProperties()
+        hPos= cgCoverPos # self.hAsPos()
+        hNeg= self.h-cgCoverNeg # self.hAsNeg()
+        # Area.
+        area= Ac
+        area+= n*(asNeg+asPos)
+        # Position of the centroid.
+        hCOGH= self.h/2.0*Ac
+        hCOGH+= hPos*n*asPos
+        hCOGH+= hNeg*n*asNeg
+        hCOGH/= area
+        # Moment of inertia of the concrete section.
+        iz= self.getI()
+        d= self.hCOG()-hCOGH # eccentricity of the concrete section.
+        iz+= Ac*d**2 # Steiner.
+        # Moment of inertia of the reinforcement (see getPosReinforcementIz
+        # and getNegReinforcementIz).
+        iz+= n*iPos+(n-1)*asPos*(hPos-hCOGH)**2
+        iz+= n*iNeg+(n-1)*asNeg*(hNeg-hCOGH)**2
+        return area, hCOGH, iz
+    
     def hCOGHomogenizedSection(self):
         '''Return the distance from the bottom fiber to the 
         centre of gravity of the homogenized section.
         '''
-        retval= self.h/2.0*self.getAc()
-        n= self.getHomogenizationCoefficient()
-        retval+= self.hAsPos()*n*self.getAsPos()
-        retval+= self.hAsNeg()*n*self.getAsNeg()
-        retval/=self.getAreaHomogenizedSection()
-        return retval
+        return self._getHomogenizedSectionProperties()[1]
     
     def getRoughVcuEstimation(self):
         '''returns a minimal value (normally shear strength will be greater)
@@ -1113,12 +1113,11 @@ class RCRectangularSection(BasicRectangularRCSection):
         :param hCOG: distance from the section bottom to its center of gravity.
         :param n: homogenizatrion coefficient.
         '''
-        retval= 0.0
-        for row in self.positvRebarRows:
-            retval+= row.getI()
-        retval*= n
-        d= self.hAsPos()-hCOG
-        retval+= (n-1)*self.getAsPos()*d**2 # Steiner.
+        # Area, inertia and cover of the rows computed in a single pass.
+        asPos, iPos, cgCover= self.positvRebarRows.getAggregateProperties()
+        retval= n*iPos
+        d= cgCover-hCOG # cgCover == self.hAsPos()
+        retval+= (n-1)*asPos*d**2 # Steiner.
         return retval
         
     def getNegReinforcementIz(self, hCOG, n= 1.0):
@@ -1128,37 +1127,25 @@ class RCRectangularSection(BasicRectangularRCSection):
         :param hCOG: distance from the section bottom to its center of gravity.
         :param n: homogenizatrion coefficient.
         '''
-        retval= 0.0
-        for row in self.negatvRebarRows:
-            retval+= row.getI()
-        retval*= n
-        d= self.hAsNeg()-hCOG
-        retval+= (n-1)*self.getAsNeg()*d**2 # Steiner.
+        # Area, inertia and cover of the rows computed in a single pass.
+        asNeg, iNeg, cgCover= self.negatvRebarRows.getAggregateProperties()
+        retval= n*iNeg
+        d= (self.h-cgCover)-hCOG # self.h-cgCover == self.hAsNeg()
+        retval+= (n-1)*asNeg*d**2 # Steiner.
         return retval
 
     def getIzHomogenizedSection(self):
         '''returns the second moment of area about the axis parallel to 
         the section width through the center of gravity'''
-        retval= self.getI() # Moment of inertia of the concrete section.
-        # Position of the centroid.
-        hCOGH= self.hCOGHomogenizedSection()
-        # Eccentricity of the concrete section.
-        d= self.hCOG()-hCOGH # distance from center of gravity.
-        retval+= self.getAc()*d**2 # Steiner.
-        # Moment of inertia of the reinforcement.
-        n= self.getHomogenizationCoefficient()
-        # Reinforcement on the possitive side.
-        retval+= self.getPosReinforcementIz(hCOG= hCOGH, n= n)
-        # Reinforcement on the possitive side.
-        retval+= self.getNegReinforcementIz(hCOG= hCOGH, n= n)
-        return retval
+        return self._getHomogenizedSectionProperties()[2]
     
     def izHomogenizedSection(self):
         '''Return the radius of gyration of the section around
            the axis parallel to the section width that passes 
            through section centroid.
         '''
-        return math.sqrt(self.getIzHomogenizedSection()/self.getAreaHomogenizedSection())
+        area, hCOGH, iz= self._getHomogenizedSectionProperties()
+        return math.sqrt(iz/area)
    
     def getIyHomogenizedSection(self):
         '''returns the second moment of area about the axis parallel to 
@@ -1246,18 +1233,9 @@ class RCRectangularSection(BasicRectangularRCSection):
     def getMinCover(self):
         ''' return the minimal cover of the reinforcement.'''
         retval= 1e6
-        posCover= self.getCoverPos()
-        if(len(posCover)>0):
-            retval= min(retval, min(posCover))
-        negCover= self.getCoverNeg()
-        if(len(negCover)>0):
-            retval= min(retval, min(negCover))
-        latPosCover= self.getLatCoverPos()
-        if(len(latPosCover)>0):
-            retval= min(retval, min(latPosCover))
-        latNegCover= self.getLatCoverNeg()
-        if(len(latNegCover)>0):
-            retval= min(retval, min(latNegCover))
+        # Single pass over the rows of both faces (cover and lateral cover).
+        for rbRow in itertools.chain(self.positvRebarRows.rebarRows, self.negatvRebarRows.rebarRows):
+            retval= min(retval, rbRow.cover, rbRow.coverLat)
         return retval
 
     def defSectionGeometry(self, preprocessor, matDiagType):
@@ -1272,24 +1250,23 @@ class RCRectangularSection(BasicRectangularRCSection):
         self.geomSection= preprocessor.getMaterialHandler.newSectionGeometry(self.gmSectionName())
         self.defConcreteRegion(self.geomSection)
         reinforcement= self.geomSection.getReinfLayers
+        reinfDiagName= self.fiberSectionParameters.reinfDiagName
+        halfB= self.b/2.0
+        halfH= self.h/2.0
         # Placement of the negative reinforcement.
         negPoints= list()
         ## Compute positions.
         for rbRow in self.negatvRebarRows.rebarRows:
-            y= -self.h/2.0+rbRow.cover
-            p1= geom.Pos2d(-self.b/2+rbRow.coverLat,y)
-            p2= geom.Pos2d(self.b/2-rbRow.coverLat,y)
-            negPoints.append((p1,p2))
-        self.negatvRebarRows.defStraightLayers(reinforcement,"neg",self.fiberSectionParameters.reinfDiagName,negPoints)
+            y= -halfH+rbRow.cover
+            negPoints.append((geom.Pos2d(-halfB+rbRow.coverLat,y), geom.Pos2d(halfB-rbRow.coverLat,y)))
+        self.negatvRebarRows.defStraightLayers(reinforcement,"neg",reinfDiagName,negPoints)
         # Placement of the positive reinforcement.
         posPoints= list()
         ## Compute positions.
         for rbRow in self.positvRebarRows.rebarRows:
-            y= self.h/2.0-rbRow.cover
-            p1= geom.Pos2d(-self.b/2+rbRow.coverLat,y)
-            p2= geom.Pos2d(self.b/2-rbRow.coverLat,y)
-            posPoints.append((p1,p2))
-        self.positvRebarRows.defStraightLayers(reinforcement,"pos",self.fiberSectionParameters.reinfDiagName,posPoints)
+            y= halfH-rbRow.cover
+            posPoints.append((geom.Pos2d(-halfB+rbRow.coverLat,y), geom.Pos2d(halfB-rbRow.coverLat,y)))
+        self.positvRebarRows.defStraightLayers(reinforcement,"pos",reinfDiagName,posPoints)
         self.minCover= self.getMinCover()
 
     def getTorsionalThickness(self):
@@ -147,12 +147,15 @@ class RCMaterialDistribution(object):
         self.sectionDefinition.createRCsections(preprocessor,matDiagType) #creates
                           #for each element in the container the fiber sections
                           #(RCsimpleSections) associated with it.
+        # The interaction diagrams are computed when the phantom model
+        # asks for them.
+        self.sectionDefinition.clearInteractionDiagrams()
         if(threeDim):
-            self.sectionDefinition.calcInteractionDiagrams(preprocessor,matDiagType)
+            diagramType= 'NMyMz'
         else:
-            self.sectionDefinition.calcInteractionDiagrams(preprocessor,matDiagType,'NMy')
+            diagramType= 'NMy'
         outputCfg.controller.solutionProcedure= outputCfg.controller.solutionProcedureType(feProblem)
-        phantomModel= phm.PhantomModel(preprocessor,self)
+        phantomModel= phm.PhantomModel(preprocessor,self, matDiagType= matDiagType, diagramType= diagramType)
         result= phantomModel.runChecking(limitStateData,outputCfg)
         return (feProblem, result)
 
@@ -37,7 +37,7 @@ class PhantomModel(object):
          (fiber models,...) is used for limit state checking at cross section 
          level (crack control, shear,...).
     '''
-    def __init__(self,preprocessor, sectionDistribution):
+    def __init__(self,preprocessor, sectionDistribution, matDiagType= None, diagramType= 'NMyMz'):
         '''Extracts the element identifiers from a XC output file generated
         with the results for each conbination analyzed 
 
@@ -46,9 +46,17 @@ class PhantomModel(object):
         :ivar sectionsDistribution:  file containing the section definition for
                                      each element (this section will be 
                                      be employed in verifications).
+        :ivar matDiagType: type of the material diagram used to compute the
+                           interaction diagrams of the sections (d: design,
+                           k: characteristic). If None the phantom 
+                           elements have no interaction diagram.
+        :ivar diagramType: type of the interaction diagrams (NMyMz, NMy 
+                           or NMz).
         '''
         self.preprocessor= preprocessor
         self.sectionsDistribution= sectionDistribution
+        self.matDiagType= matDiagType
+        self.diagramType= diagramType
 
     def setupForElementsAndCombinations(self,intForcCombFileName,setCalc=None):
         '''Extracts element and combination identifiers from the internal
@@ -125,13 +133,13 @@ class PhantomModel(object):
             elementSectionNames= self.sectionsDistribution.getSectionNamesForElement(tagElem)
             if(elementSectionNames):
                 elementSectionDefinitions= self.sectionsDistribution.getSectionDefinitionsForElement(tagElem)
-                mapInteractionDiagrams= self.sectionsDistribution.sectionDefinition.mapInteractionDiagrams
+                sectionDefinition= self.sectionsDistribution.sectionDefinition
                 sz= len(elementSectionNames)
                 for i in range(0,sz):
                     sectionName= elementSectionNames[i]
                     diagInt= None
-                    if(mapInteractionDiagrams is not None):
-                        diagInt= mapInteractionDiagrams[sectionName]
+                    if(self.matDiagType is not None):
+                        diagInt= sectionDefinition.getInteractionDiagram(sectionName, self.preprocessor, self.matDiagType, self.diagramType)
           #         print('tagElem =',tagElem,' sectionName=',sectionName,' elSecDef=',elementSectionDefinitions[i],' sectIndex=', i+1,' diagInt=', diagInt)
                     phantomElem= self.createPhantomElement(tagElem,sectionName,elementSectionDefinitions[i],i+1,diagInt, outputCfg.controller.fakeSection)
                     retval.append(phantomElem)
@@ -377,12 +377,12 @@ GEOM_FT PolygonalSurface2d::getCover(const Pos2d &p) const
 
 //! @brief Return the distance from the point to the nearest
 //! of the intersections of the ray defined by the point and
-//! the vector with the nearest edge.
-GEOM_FT PolygonalSurface2d::getCover(const Pos2d &p, const Vector2d &vdir) const
+//! the vector with the polyline argument.
+static GEOM_FT get_cover(const Polyline2d &pline, const Pos2d &p, const Vector2d &vdir)
   {
     GEOM_FT retval= std::nan("0");
     Ray2d r(p,vdir);
-    GeomObj::list_Pos2d intersections= getPolyline().getIntersection(r);
+    GeomObj::list_Pos2d intersections= pline.getIntersection(r);
     if(!intersections.empty())
       {
 	GeomObj::list_Pos2d::const_iterator i= intersections.begin();
@@ -399,6 +399,40 @@ GEOM_FT PolygonalSurface2d::getCover(const Pos2d &p, const Vector2d &vdir) const
     return retval;
   }
 
+//! @brief Return the distance from the point to the nearest
+//! of the intersections of the ray defined by the point and
+//! the vector with the nearest edge.
+GEOM_FT PolygonalSurface2d::getCover(const Pos2d &p, const Vector2d &vdir) const
+  { return get_cover(getPolyline(), p, vdir); }
+
+//! @brief Return the covers of the positions in the list
+//! (Python interface).
+boost::python::list PolygonalSurface2d::getCoversPy(const boost::python::list &l) const
+  {
+    boost::python::list retval;
+    const int sz= len(l);
+    for(int i=0; i<sz; i++)
+      retval.append(getCover(boost::python::extract<Pos2d>(l[i])));
+    return retval;
+  }
+
+//! @brief Return the distances from each of the positions in the list
+//! to the nearest of the intersections of the ray defined by the point
+//! and the vector with the nearest edge (Python interface). The polyline
+//! is computed only once for all the positions.
+boost::python::list PolygonalSurface2d::getCoversPy(const boost::python::list &l, const Vector2d &vdir) const
+  {
+    boost::python::list retval;
+    const Polyline2d pline= getPolyline();
+    const int sz= len(l);
+    for(int i=0; i<sz; i++)
+      {
+        const Pos2d p= boost::python::extract<Pos2d>(l[i]);
+        retval.append(get_cover(pline, p, vdir));
+      }
+    return retval;
+  }
+
 void PolygonalSurface2d::Print(std::ostream &os) const
   {
     unsigned int nv= getNumVertices();
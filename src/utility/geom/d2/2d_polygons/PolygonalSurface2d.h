@@ -92,6 +92,8 @@ class PolygonalSurface2d: public Surface2d
     GEOM_FT Dist(const Pos2d &p) const;
     GEOM_FT getCover(const Pos2d &) const;
     GEOM_FT getCover(const Pos2d &, const Vector2d &) const;
+    boost::python::list getCoversPy(const boost::python::list &) const;
+    boost::python::list getCoversPy(const boost::python::list &, const Vector2d &) const;
 
     bool Overlap(const Line2d &r) const;
     bool Overlap(const Ray2d &sr) const;
@@ -24,6 +24,8 @@
 Segment2d (PolygonalSurface2d::*getSide0Segment)(unsigned int i) const= &PolygonalSurface2d::Lado0;
 GEOM_FT (PolygonalSurface2d::*getCoverA)(const Pos2d &) const= &PolygonalSurface2d::getCover;
 GEOM_FT  (PolygonalSurface2d::*getCoverB)(const Pos2d &, const Vector2d &) const= &PolygonalSurface2d::getCover;
+boost::python::list (PolygonalSurface2d::*getCoversA)(const boost::python::list &) const= &PolygonalSurface2d::getCoversPy;
+boost::python::list (PolygonalSurface2d::*getCoversB)(const boost::python::list &, const Vector2d &) const= &PolygonalSurface2d::getCoversPy;
 Segment2d (PolygonalSurface2d::*clipLine)(const Line2d &) const=&PolygonalSurface2d::Clip;
 Segment2d (PolygonalSurface2d::*clipRay)(const Ray2d &) const=&PolygonalSurface2d::Clip;
 Segment2d (PolygonalSurface2d::*clipSegment)(const Segment2d &) const=&PolygonalSurface2d::Clip;
@@ -49,6 +51,8 @@ class_<PolygonalSurface2d, bases<Surface2d>, boost::noncopyable >("PolygonalSurf
   .def("getRecubrimiento",getCoverA,"TO DEPRECATE. Return the cover of the position inside the surface.")
   .def("getCover",getCoverA,"Return the cover of the position inside the surface.")
   .def("getCover",getCoverB,"Return the distance from the point to the nearest of the intersections of the ray defined by the point and the vector with the nearest edge.")
+  .def("getCovers",getCoversA,"Return the covers of the positions of the list argument.")
+  .def("getCovers",getCoversB,"Return the distances from each of the positions of the list argument to the nearest of the intersections of the ray defined by the point and the vector with the nearest edge.")
   .def("clip",clipLine, "Clips the line by the polygonal surface.")
   .def("clip",clipRay, "Clips the ray by the polygonal surface.")
   .def("clip",clipSegment, "Clips the segment by the polygonal surface.")
@@ -80,6 +80,7 @@ echo "$BLEU" "    Polylines." "$NORMAL"
 python tests/utility/geom/pos2d_list_test_01.py
 python tests/utility/geom/polyline2d_test_01.py
 python tests/utility/geom/polyline2d_test_02.py
+python tests/utility/geom/folding_planes_test_01.py
 python tests/utility/geom/polyline3d_test_01.py
 python tests/utility/geom/polyline3d_test_02.py
 echo "$BLEU" "    Polygons." "$NORMAL"
@@ -95,6 +96,7 @@ python tests/utility/geom/polygons/polygon2D_test_2d_09.py
 python tests/utility/geom/polygons/polygon2D_test_2d_10.py
 python tests/utility/geom/polygons/polygon2D_test_2d_11.py
 python tests/utility/geom/polygons/polygon2D_test_2d_12.py
+python tests/utility/geom/polygons/polygon2D_test_2d_13.py
 python tests/utility/geom/polygons/polygon3D_test_01.py
 python tests/utility/geom/polygons/polygon3D_test_02.py
 python tests/utility/geom/polygons/polygon3D_test_03.py
@@ -109,6 +111,7 @@ python tests/utility/geom/circle2d_test_01.py
 python tests/utility/geom/circle2d_test_02.py
 echo "$BLEU" "    Parabolas." "$NORMAL"
 python tests/utility/geom/parabola_test_01.py
+python tests/utility/geom/parabola_test_02.py
 echo "$BLEU" "    Sliding vectors." "$NORMAL"
 python tests/utility/geom/sliding_vectors_systems/sliding_vector_2d_test_01.py
 python tests/utility/geom/sliding_vectors_systems/sliding_vector_3d_test_01.py
@@ -812,6 +815,8 @@ python tests/materials/xc_materials/sections/fiber_section/interaction_diagram/t
 python tests/materials/xc_materials/sections/fiber_section/interaction_diagram/test_interaction_diagram04.py
 python tests/materials/xc_materials/sections/fiber_section/interaction_diagram/test_interaction_diagram05.py
 python tests/materials/xc_materials/sections/fiber_section/interaction_diagram/test_interaction_diagram06.py
+python tests/materials/xc_materials/sections/fiber_section/interaction_diagram/test_interaction_diagram07.py
+python tests/materials/xc_materials/sections/fiber_section/interaction_diagram/test_interaction_diagram08.py
 python tests/materials/xc_materials/sections/fiber_section/plastic_hinge_on_IPE200.py
 echo "$BLEU" "        Membrane plate fiber section tests." "$NORMAL"
 python tests/materials/xc_materials/sections/fiber_section/membrane_plate/test_membrane_plate_fiber_material_01.py
@@ -825,6 +830,7 @@ echo "$BLEU" "    concrete shapes tests." "$NORMAL"
 python tests/materials/concrete_shapes/test_mass_properties_rc_section.py
 python tests/materials/concrete_shapes/test_reinf_row_01.py
 python tests/materials/concrete_shapes/test_reinf_layers_01.py
+python tests/materials/concrete_shapes/test_reinf_pickling_01.py
 python tests/materials/concrete_shapes/test_rc_section_01.py
 python tests/materials/concrete_shapes/test_rc_section_02.py
 python tests/materials/concrete_shapes/test_reinforcement_placement_01.py
@@ -978,6 +984,7 @@ python tests/materials/astm_aisc/connection_design/anchor_bolt_design_test_01.py
 python tests/materials/astm_aisc/connection_design/bolt_fastener_design_test_01.py
 python tests/materials/astm_aisc/connection_design/bolt_fastener_design_test_02.py
 python tests/materials/astm_aisc/connection_design/bolted_plate_test_01.py
+python tests/materials/astm_aisc/connection_design/bolted_plate_test_02.py
 python tests/materials/astm_aisc/connection_design/bolted_flange_plate_connection_01.py
 python tests/materials/astm_aisc/connection_design/bolted_flange_plate_connection_02.py
 python tests/materials/astm_aisc/connection_design/bolted_web_shear_tab_connection_01.py
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+''' Check that a bolted plate written to a JSON file is read back
+    with the same values (including non-finite ones).'''
+
+from __future__ import division
+from __future__ import print_function
+
+__author__= "Luis C. Pérez Tato (LCPT) and Ana Ortega (AO_O)"
+__copyright__= "Copyright 2015, LCPT and AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@ciccp.es ana.ortega@ciccp.es"
+
+import os
+import math
+import tempfile
+from materials.astm_aisc import ASTM_materials
+from misc_utils import units_utils
+
+bolt= ASTM_materials.BoltFastener(0.75*units_utils.inchToMeter, steelType= ASTM_materials.A325) # group A
+boltArray= ASTM_materials.BoltArray(bolt, nRows= 2, nCols= 3)
+boltedPlateA= ASTM_materials.BoltedPlate(boltArray, thickness= 20e-3, steelType= ASTM_materials.A36, doublePlate= True)
+
+tmpDir= tempfile.mkdtemp()
+fileName= os.path.join(tmpDir, 'bolted_plate.json')
+
+# Write and read the plate.
+boltedPlateA.jsonWrite(fileName)
+boltedPlateB= ASTM_materials.BoltedPlate(ASTM_materials.BoltArray())
+boltedPlateB.jsonRead(fileName)
+dictA= boltedPlateA.getDict()
+roundTripOk= (boltedPlateB.getDict()==dictA)
+
+# Non-finite values are preserved.
+boltedPlateA.thickness= float('nan')
+boltedPlateA.jsonWrite(fileName)
+boltedPlateC= ASTM_materials.BoltedPlate(ASTM_materials.BoltArray())
+boltedPlateC.jsonRead(fileName)
+dictC= boltedPlateC.getDict()
+nanOk= math.isnan(boltedPlateC.thickness)
+del dictA['thickness']
+del dictC['thickness']
+nanOk= nanOk and (dictC==dictA)
+
+os.remove(fileName) # Clean after yourself.
+os.rmdir(tmpDir)
+
+'''
+print(roundTripOk)
+print(nanOk)
+'''
+
+from misc_utils import log_messages as lmsg
+fname= os.path.basename(__file__)
+if(roundTripOk and nanOk):
+    print('test '+fname+': ok.')
+else:
+    lmsg.error(fname+' ERROR.')
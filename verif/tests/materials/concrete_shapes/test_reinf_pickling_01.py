@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+''' Check that the reinforcement classes (and the classes derived from
+    them) keep all their attributes when they are pickled or copied.'''
+
+from __future__ import division
+from __future__ import print_function
+
+__author__= "Ana Ortega (AO_O), Luis C. Pérez Tato (LCPT)"
+__copyright__= "Copyright 2016, AO_O, LCPT"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "ana.ortega@ciccp.es, l.pereztato@ciccp.es"
+
+import copy
+import pickle
+from materials.sections.fiber_section import def_simple_RC_section
+
+class MarkedReinfRow(def_simple_RC_section.ReinfRow):
+    ''' Reinforcement row with a mark (derived class with its own slots).'''
+    __slots__= ('mark',)
+    def __init__(self, mark, **kwargs):
+        super(MarkedReinfRow,self).__init__(**kwargs)
+        self.mark= mark
+
+class DescribedShearReinforcement(def_simple_RC_section.ShearReinforcement):
+    ''' Shear reinforcement with a description (derived class without
+        slots, so its instances have a __dict__).'''
+    def __init__(self, description, **kwargs):
+        super(DescribedShearReinforcement,self).__init__(**kwargs)
+        self.description= description
+
+class NamedReinfLayers(def_simple_RC_section.LongReinfLayers):
+    ''' Reinforcement layers with a name (derived class without slots).'''
+    pass
+
+row= MarkedReinfRow(mark= 'A1', rebarsDiam= 12e-3, rebarsSpacing= 0.15, width= 1.0, nominalCover= 0.035)
+shReinf= DescribedShearReinforcement(description= 'stirrups', familyName= 'sh', nShReinfBranches= 2, areaShReinfBranch= 0.5e-4, shReinfSpacing= 0.2)
+layers= NamedReinfLayers([row])
+layers.name= 'bottom'
+
+def sameRow(a, b):
+    ''' Return true if both rows are equal and have the same mark.'''
+    return (type(a) is type(b)) and (a==b) and (a.mark==b.mark) and (a.coverLat==b.coverLat)
+
+ok= True
+for cp in [lambda obj: pickle.loads(pickle.dumps(obj)), copy.copy, copy.deepcopy]:
+    rowCopy= cp(row)
+    shReinfCopy= cp(shReinf)
+    layersCopy= cp(layers)
+    ok= ok and sameRow(rowCopy, row)
+    ok= ok and (type(shReinfCopy) is DescribedShearReinforcement) and (shReinfCopy==shReinf) and (shReinfCopy.description=='stirrups')
+    ok= ok and (type(layersCopy) is NamedReinfLayers) and (layersCopy==layers) and (layersCopy.name=='bottom') and sameRow(layersCopy.rebarRows[0], row)
+
+'''
+print(ok)
+'''
+
+import os
+from misc_utils import log_messages as lmsg
+fname= os.path.basename(__file__)
+if ok:
+    print('test '+fname+': ok.')
+else:
+    lmsg.error(fname+' ERROR.')
@@ -47,12 +47,26 @@ c6_1= UPN400.getClassInternalPartInCompression()
 c6_2= UPN400.getClassInternalPartInBending()
 c6_3= UPN400.getClassOutstandPartInCompression()
 
+# Parts exceeding all the limits (class 4) and limit values.
+c7_1= IPE300.getClassInternalPartInCompression(ratioCT= 50.0)
+c7_2= IPE300.getClassInternalPartInBending(ratioCT= 130.0)
+c7_3= IPE300.getClassOutstandPartInCompression(ratioCT= 20.0)
+c7_4= IPE300.getClassInternalPartInCompression(ratioCT= 33.0)
+c7_5= EC3_materials.classifyBatch([33.0, 35.0, 40.0, 50.0], S235JR.fy, 'internalCompression').tolist()
+
+# C length of the internal part (table 5.2 EC3-1-1).
+cf1= IPE300.getCfactIntPart()/IPE300.tw()-IPE300.widthToThicknessWeb()
+cf2= RHS250.getCfactIntPart()/RHS250.t()-RHS250.widthToThicknessWeb()
+
 ratioLst=[c1_1-3,c1_2-1,c1_3-1,
           c2_1-1,c2_2-1,c2_3-1,
           c3_1-1,c3_2-1,c3_3-1,
           c4_1-1,c4_2-1,
           c5_1-1,c5_2-1,
-          c6_1-1,c6_2-1,c6_3-1]
+          c6_1-1,c6_2-1,c6_3-1,
+          c7_1-4,c7_2-4,c7_3-4,c7_4-1,
+          sum(abs(a-b) for a, b in zip(c7_5,[1,2,3,4])),
+          cf1,cf2]
 
 import os
 from misc_utils import log_messages as lmsg
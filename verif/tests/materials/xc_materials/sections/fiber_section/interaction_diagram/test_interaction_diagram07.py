@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+''' Check that the interaction diagrams stored in the cache directory of
+    a section container are reused and give the same capacity factors as
+    the computed ones, and that a modified section doesn't reuse an
+    outdated diagram.'''
+
+from __future__ import print_function
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT) and Ana Ortega (AO_O)"
+__copyright__= "Copyright 2016, LCPT and AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@ciccp.es ana.ortega@ciccp.es"
+
+import os
+import shutil
+import tempfile
+import geom
+import xc
+from materials.ehe import EHE_materials
+from materials.sections.fiber_section import def_simple_RC_section
+from materials.sections import RC_sections_container as sc
+from postprocess import element_section_map
+
+concrete= EHE_materials.HA30
+reinfSteel= EHE_materials.B500S
+basicCover= 0.06
+rebarSpacing= 0.2
+
+def defSectionContainer(dir2RebarsDiam, cacheDir):
+    ''' Compute the interaction diagrams of a slab section in a new
+        finite element problem.
+
+    :param dir2RebarsDiam: diameter of the rebars in direction 2.
+    :param cacheDir: cache directory for the interaction diagrams.
+    '''
+    feProblem= xc.FEProblem()
+    preprocessor=  feProblem.getPreprocessor
+    # The stress-strain diagrams are not defined in the new problem yet.
+    concrete.setupName(concrete.materialName)
+    reinfSteel.setupName(reinfSteel.materialName)
+    deckSections= element_section_map.RCSlabBeamSection("deck","RC deck.",concrete, reinfSteel,0.3)
+    dir2Area= EHE_materials.Fi12*(dir2RebarsDiam/12e-3)**2
+    deckSections.dir2PositvRebarRows= def_simple_RC_section.LongReinfLayers([def_simple_RC_section.ReinfRow(rebarsDiam= dir2RebarsDiam, areaRebar= dir2Area, rebarsSpacing= rebarSpacing, nominalCover= basicCover)])
+    deckSections.dir2NegatvRebarRows= def_simple_RC_section.LongReinfLayers([def_simple_RC_section.ReinfRow(rebarsDiam= dir2RebarsDiam, areaRebar= dir2Area, rebarsSpacing= rebarSpacing, nominalCover= basicCover)])
+    deckSections.dir1PositvRebarRows= def_simple_RC_section.LongReinfLayers([def_simple_RC_section.ReinfRow(rebarsDiam= 20e-3, areaRebar= EHE_materials.Fi20, rebarsSpacing= rebarSpacing, nominalCover= basicCover+12e-3)])
+    deckSections.dir1NegatvRebarRows= def_simple_RC_section.LongReinfLayers([def_simple_RC_section.ReinfRow(rebarsDiam= 20e-3, areaRebar= EHE_materials.Fi20, rebarsSpacing= rebarSpacing, nominalCover= basicCover+12e-3)])
+    sections= sc.SectionContainer(interactionDiagramsCacheDir= cacheDir)
+    sections.append(deckSections)
+    sections.createRCsections(preprocessor, 'd')
+    sections.calcInteractionDiagrams(preprocessor, 'd')
+    return feProblem, sections
+
+internalForces= [geom.Pos3d(-1000e3, 50e3, 0.0), geom.Pos3d(200e3, 20e3, 0.0), geom.Pos3d(0.0, -80e3, 0.0)]
+
+def getCapacityFactors(feProblem, sections):
+    ''' Return the capacity factors for the internal forces above.'''
+    retval= list()
+    for name in ['deck1', 'deck2']:
+        diagram= sections.getInteractionDiagram(name, feProblem.getPreprocessor, 'd')
+        retval.extend([diagram.getCapacityFactor(f) for f in internalForces])
+    return retval
+
+cacheDir= tempfile.mkdtemp()
+
+# Compute the diagrams and write them in the cache directory.
+feProblemA, sectionsA= defSectionContainer(12e-3, cacheDir)
+cfA= getCapacityFactors(feProblemA, sectionsA)
+filesA= sorted(os.listdir(cacheDir))
+
+# Read the diagrams from the cache directory.
+feProblemB, sectionsB= defSectionContainer(12e-3, cacheDir)
+cfB= getCapacityFactors(feProblemB, sectionsB)
+filesB= sorted(os.listdir(cacheDir))
+materialHandlerB= feProblemB.getPreprocessor.getMaterialHandler
+diagramNamesOk= materialHandlerB.interactionDiagExists('diagIntdeck1') and materialHandlerB.interactionDiagExists('diagIntdeck2')
+idParamsOk= all(hasattr(rcs.fiberSectionParameters, 'idParams') for rcs in sectionsB.mapSections.values())
+err= max(abs(a-b)/abs(a) for a, b in zip(cfA, cfB))
+
+# Modify the rebars in direction 2: a new diagram is computed for the
+# section deck2 only.
+feProblemC, sectionsC= defSectionContainer(16e-3, cacheDir)
+filesC= sorted(os.listdir(cacheDir))
+newFiles= [f for f in filesC if f not in filesA]
+
+shutil.rmtree(cacheDir) # Clean after yourself.
+
+'''
+print(cfA)
+print(cfB)
+print(err)
+print(filesA)
+print(newFiles)
+'''
+
+from misc_utils import log_messages as lmsg
+fname= os.path.basename(__file__)
+if((len(filesA)==2) and (filesB==filesA) and (err<1e-6) and diagramNamesOk and idParamsOk and (len(newFiles)==1) and newFiles[0].startswith('deck2_')):
+    print('test '+fname+': ok.')
+else:
+    lmsg.error(fname+' ERROR.')
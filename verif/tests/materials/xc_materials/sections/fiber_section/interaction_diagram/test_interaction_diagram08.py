@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+''' Check the sections appended to a section container with appendSections
+    and the lazy computation of their interaction diagrams with
+    getInteractionDiagram.'''
+
+from __future__ import print_function
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT) and Ana Ortega (AO_O)"
+__copyright__= "Copyright 2016, LCPT and AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@ciccp.es ana.ortega@ciccp.es"
+
+import logging
+import xc
+from materials.ehe import EHE_materials
+from materials.sections.fiber_section import def_simple_RC_section
+from materials.sections import RC_sections_container as sc
+from postprocess import element_section_map
+
+class ErrorCounter(logging.Handler):
+    ''' Count the error messages.'''
+    def __init__(self):
+        super(ErrorCounter,self).__init__(level= logging.ERROR)
+        self.numErrors= 0
+    def emit(self, record):
+        self.numErrors+= 1
+
+feProblem= xc.FEProblem()
+preprocessor=  feProblem.getPreprocessor
+concrete= EHE_materials.HA30
+reinfSteel= EHE_materials.B500S
+
+def defSlabSections(name, depth):
+    ''' Return the sections of a slab.
+
+    :param name: name of the sections.
+    :param depth: depth of the slab.
+    '''
+    retval= element_section_map.RCSlabBeamSection(name,"RC slab.",concrete, reinfSteel, depth)
+    reinfLayers= def_simple_RC_section.LongReinfLayers([def_simple_RC_section.ReinfRow(rebarsDiam= 12e-3, areaRebar= EHE_materials.Fi12, rebarsSpacing= 0.2, nominalCover= 0.05)])
+    retval.dir1PositvRebarRows= reinfLayers
+    retval.dir1NegatvRebarRows= reinfLayers
+    retval.dir2PositvRebarRows= reinfLayers
+    retval.dir2NegatvRebarRows= reinfLayers
+    return retval
+
+sections= sc.SectionContainer()
+sections.appendSections([defSlabSections("slabA", 0.25), defSlabSections("slabB", 0.3)])
+appendOk= ((len(sections.sections)==2) and (sorted(sections.mapOuterSections.keys())==['slabA', 'slabB']) and (sorted(sections.mapSections.keys())==['slabA1', 'slabA2', 'slabB1', 'slabB2']))
+
+sections.createRCsections(preprocessor, 'd')
+
+# The diagram is computed the first time it's requested.
+diagA1= sections.getInteractionDiagram('slabA1', preprocessor, 'd')
+firstAccessOk= (diagA1 is not None) and (list(sections.mapInteractionDiagrams.keys())==[('slabA1', 'd', 'NMyMz')])
+# and reused afterwards.
+secondAccessOk= (sections.getInteractionDiagram('slabA1', preprocessor, 'd') is diagA1) and (len(sections.mapInteractionDiagrams)==1)
+
+# Other diagram types are stored separately.
+diagA1NMy= sections.getInteractionDiagram('slabA1', preprocessor, 'd', 'NMy')
+diagramTypeOk= (diagA1NMy is not None) and (diagA1NMy is not diagA1) and (sections.getInteractionDiagram('slabA1', preprocessor, 'd') is diagA1) and (len(sections.mapInteractionDiagrams)==2)
+
+# Only the most recently used diagrams are kept.
+sections.maxInteractionDiagrams= 2
+diagB1= sections.getInteractionDiagram('slabB1', preprocessor, 'd')
+lruOk= (list(sections.mapInteractionDiagrams.keys())==[('slabA1', 'd', 'NMyMz'), ('slabB1', 'd', 'NMyMz')])
+
+# Unknown section name and unknown diagram type (the error messages are
+# counted instead of displayed).
+rootLogger= logging.getLogger()
+rootHandlers= rootLogger.handlers
+errorCounter= ErrorCounter()
+rootLogger.handlers= [errorCounter]
+unknownName= sections.getInteractionDiagram('slabC1', preprocessor, 'd')
+unknownType= sections.getInteractionDiagram('slabB2', preprocessor, 'd', 'NMx')
+rootLogger.handlers= rootHandlers
+unknownOk= (unknownName is None) and (unknownType is None) and (errorCounter.numErrors==2) and (len(sections.mapInteractionDiagrams)==2)
+
+'''
+print(appendOk)
+print(firstAccessOk)
+print(secondAccessOk)
+print(diagramTypeOk)
+print(lruOk)
+print(unknownOk)
+'''
+
+import os
+from misc_utils import log_messages as lmsg
+fname= os.path.basename(__file__)
+if(appendOk and firstAccessOk and secondAccessOk and diagramTypeOk and lruOk and unknownOk):
+    print('test '+fname+': ok.')
+else:
+    lmsg.error(fname+' ERROR.')
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+''' Check that XYFoldingPlanes.getIntersectionsWith3DSegments gives the
+    same results as getIntersectionWith3DSegment.'''
+
+from __future__ import print_function
+
+__author__= "Luis C. Pérez Tato (LCPT) and Ana Ortega (AO_O)"
+__copyright__= "Copyright 2016, LCPT and AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@ciccp.es ana.ortega@ciccp.es"
+
+import geom
+import numpy as np
+from geom_utils import section_by_folding_planes as sfp
+
+# Folding planes.
+pline= geom.Polyline2d()
+pline.appendVertex(geom.Pos2d(0,0))
+pline.appendVertex(geom.Pos2d(10,0))
+pline.appendVertex(geom.Pos2d(10,10))
+pline.appendVertex(geom.Pos2d(20,10))
+foldingPlanes= sfp.XYFoldingPlanes(pline)
+
+# Segments.
+endPoints= [((5,-5,0),(5,5,2)), # crosses the first plane.
+            ((-5,5,1),(25,5,1)), # crosses the second plane.
+            ((0,5,-2),(20,12,3)), # crosses the second and the third planes.
+            ((12,-3,0),(18,-1,0)), # no intersection.
+            ((5,0,-1),(5,0,1)), # vertical segment on the first plane.
+            ((3,7,-1),(3,7,1))] # vertical segment, no intersection.
+segments= [geom.Segment3d(geom.Pos3d(*p0), geom.Pos3d(*p1)) for p0, p1 in endPoints]
+
+# Intersections one segment at a time.
+refIntersections= list()
+for sg in segments:
+    try:
+        refIntersections.append(foldingPlanes.getIntersectionWith3DSegment(sg))
+    except ZeroDivisionError: # vertical segment.
+        refIntersections.append([])
+
+# Intersections computed in batch from the segments and from an array.
+intersections= foldingPlanes.getIntersectionsWith3DSegments(segments)
+intersectionsArray= foldingPlanes.getIntersectionsWith3DSegments(np.array(endPoints, dtype= float))
+
+def dist(pointsA, pointsB):
+    ''' Return the maximum distance between the points of both lists.'''
+    if(len(pointsA)!=len(pointsB)):
+        return 1e6
+    retval= 0.0
+    for pA, pB in zip(pointsA, pointsB):
+        retval= max(retval, pA.dist(pB))
+    return retval
+
+err= 0.0
+for ref, pts, ptsArray in zip(refIntersections, intersections, intersectionsArray):
+    err= max(err, dist(ref, pts), dist(ref, ptsArray))
+numIntersections= [len(pts) for pts in intersections]
+
+'''
+print(numIntersections)
+print(err)
+'''
+
+import os
+from misc_utils import log_messages as lmsg
+fname= os.path.basename(__file__)
+if((numIntersections==[1,1,2,0,0,0]) and (len(intersectionsArray)==len(segments)) and (err<1e-9)):
+    print('test: '+fname+': ok.')
+else:
+    lmsg.error(fname+' ERROR.')
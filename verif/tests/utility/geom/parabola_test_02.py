@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+''' Evaluation of Parabola objects over NumPy arrays.'''
+
+from __future__ import print_function
+
+__author__= "Luis C. Pérez Tato (LCPT) and Ana Ortega (AOO)"
+__copyright__= "Copyright 2022, LCPT and AOO"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com"
+
+import math
+import numpy as np
+import geom
+from geom_utils import parabola as pb
+
+p0= geom.Pos2d(-10,100)
+p1= geom.Pos2d(2.0,3.0)
+p2= geom.Pos2d(10,120)
+
+parabola= pb.Parabola(p0,p1,p2)
+
+xi= np.linspace(p0.x, p2.x, 21)
+yi= parabola.y(xi)
+yPi= parabola.yP(xi)
+yPPi= parabola.yPP(xi)
+curvatures= parabola.curvature(xi)
+alphas= parabola.alpha(xi)
+
+# Compare with the values computed one by one.
+err= 0
+for x, y, yP, yPP, curvature, alpha in zip(xi, yi, yPi, yPPi, curvatures, alphas):
+    x= float(x)
+    err+= (y-parabola.y(x))**2
+    err+= (yP-parabola.yP(x))**2
+    err+= (yPP-parabola.yPP(x))**2
+    err+= (curvature-parabola.curvature(x))**2
+    err+= (alpha-parabola.alpha(x))**2
+err= math.sqrt(err)
+
+# print("err= ", err)
+  
+import os
+from misc_utils import log_messages as lmsg
+fname= os.path.basename(__file__)
+if (err<1e-10 and len(yPPi)==len(xi)):
+    print('test '+fname+': ok.')
+else:
+    lmsg.error(fname+' ERROR.')
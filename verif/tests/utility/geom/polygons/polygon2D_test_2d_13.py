@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+''' Test of cover calculations of a list of points inside a polygon.'''
+from __future__ import print_function
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT) and Ana Ortega (AO_O)"
+__copyright__= "Copyright 2015, LCPT and AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@ciccp.es ana.ortega@ciccp.es"
+
+import math
+import geom
+
+plg=geom.Polygon2d()
+
+#        +--------+
+#        |        |
+#        |        |
+#        |        |
+#        |        |
+#        +--------+
+
+plg.appendVertex(geom.Pos2d(0,0))
+plg.appendVertex(geom.Pos2d(1,0))
+plg.appendVertex(geom.Pos2d(1,1))
+plg.appendVertex(geom.Pos2d(0,1))
+
+points= [geom.Pos2d(0.5,0.5), geom.Pos2d(0.25,0.5), geom.Pos2d(0.5,0.75)]
+vDir= geom.Vector2d(1.0,-1.0)
+covers= plg.getCovers(points)
+coversInDir= plg.getCovers(points, vDir)
+
+# Compare with the values computed point by point.
+err= 0.0
+for p, cover, coverInDir in zip(points, covers, coversInDir):
+    err+= (cover-plg.getCover(p))**2
+    err+= (coverInDir-plg.getCover(p, vDir))**2
+err= math.sqrt(err)
+
+ratio1= abs(len(covers)-len(points))+abs(len(coversInDir)-len(points))
+ratio2= abs(covers[1]-0.25)/0.25
+
+'''
+print('covers= ', covers)
+print('coversInDir= ', coversInDir)
+print('err= ', err)
+print('ratio2= ', ratio2)
+'''
+
+import os
+from misc_utils import log_messages as lmsg
+fname= os.path.basename(__file__)
+if(ratio1==0 and err<1e-15 and ratio2<1e-15):
+    print('test: '+fname+': ok.')
+else:
+    lmsg.error('test: '+fname+' ERROR.')